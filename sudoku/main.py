@@ -1,8 +1,15 @@
 import tkinter as tk
-from tkinter import messagebox, ttk, filedialog, colorchooser
+from tkinter import messagebox, filedialog, colorchooser
+from tkinter import font as tkfont
 import random
-import copy
+import re
+import functools
 import time
+import os
+import queue
+from types import MappingProxyType
+import multiprocessing
+import concurrent.futures
 
 # ------------------- Default Color Theme -------------------
 COLORS = {
@@ -35,141 +42,461 @@ COLORS = {
     'hint_bg': '#fef3c7'
 }
 
+# Accent color and level label of each difficulty, shared read-only
+DIFFICULTY_COLORS = MappingProxyType({
+    "easy": COLORS['success'],
+    "medium": COLORS['warning'],
+    "hard": COLORS['error'],
+    "expert": COLORS['gray_800']
+})
+DIFFICULTY_LABELS = MappingProxyType({
+    difficulty: f"📊 Level: {difficulty.title()}" for difficulty in DIFFICULTY_COLORS
+})
+
+# Tk named font used by ModernButton when no font is given
+BUTTON_FONT = 'SudokuButtonFont'
+
+# Timer label texts for the first hour, which covers the longest countdown,
+# indexed by seconds so a timer tick is a lookup instead of a format
+_TIMER_TEXTS = tuple(
+    f"⏱ {minutes:02d}:{seconds:02d}"
+    for minutes, seconds in (divmod(total, 60) for total in range(3601))
+)
+
+# Strips everything but the digits from a loaded puzzle file
+_NONDIGIT = re.compile(r'[^0-9]')
+# Maps the ASCII digits b'0'-b'9' to the byte values 0-9
+_DIGIT_VALUES = bytes.maketrans(b'0123456789', bytes(range(10)))
+
+# ------------------- Board Geometry -------------------
+
+# Lookup tables indexed by flat cell index (row * 9 + col)
+ROW_OF = bytes(idx // 9 for idx in range(81))
+COL_OF = bytes(idx % 9 for idx in range(81))
+BOX_OF = bytes((r // 3) * 3 + c // 3 for r in range(9) for c in range(9))
+
+# Cells of the 27 units: rows 0-8, columns 9-17, boxes 18-26
+UNIT_CELLS = (
+    tuple(tuple(r * 9 + c for c in range(9)) for r in range(9)) +
+    tuple(tuple(r * 9 + c for r in range(9)) for c in range(9)) +
+    tuple(tuple(idx for idx in range(81) if BOX_OF[idx] == b) for b in range(9))
+)
+
+# Bit of each digit in a unit mask (digit 0 maps to no bit) and its inverse
+DIGIT_BIT = (0, 1, 2, 4, 8, 16, 32, 64, 128, 256)
+BIT_TO_DIGIT = {1 << i: i + 1 for i in range(9)}
+
+# Number of candidates in each 9-bit digit mask
+POPCOUNT = bytes(bin(mask).count('1') for mask in range(512))
+
+# The 20 cells sharing a row, column or box with each cell
+PEERS = tuple(
+    frozenset(UNIT_CELLS[ROW_OF[idx]] + UNIT_CELLS[9 + COL_OF[idx]] + UNIT_CELLS[18 + BOX_OF[idx]]) - {idx}
+    for idx in range(81)
+)
+
 # ------------------- Smart Sudoku Solver -------------------
 
-class SmartSudokuSolver:
-    """Advanced Sudoku solver with comprehensive validation"""
+def flatten_board(board):
+    """Convert a 9x9 grid into the flat 81-cell bytearray used by the solver"""
+    return bytearray(num for row in board for num in row)
+
+def unflatten_board(board):
+    """Convert a flat 81-cell board back into a 9x9 grid of lists"""
+    return [list(board[i * 9:i * 9 + 9]) for i in range(9)]
+
+def _propagate_singles(board, row_mask, col_mask, box_mask, trail, cells):
+    """Fill every empty cell that has a single candidate until none are left.
     
-    @staticmethod
-    def is_valid_move(board, row, col, num):
-        """Check if placing num at (row, col) is valid according to Sudoku rules"""
-        for j in range(9):
-            if j != col and board[row][j] == num:
-                return False
-        
-        for i in range(9):
-            if i != row and board[i][col] == num:
-                return False
-        
-        start_row, start_col = 3 * (row // 3), 3 * (col // 3)
-        for i in range(start_row, start_row + 3):
-            for j in range(start_col, start_col + 3):
-                if (i != row or j != col) and board[i][j] == num:
+    Only the given cells are scanned. Each filled cell index is appended to
+    trail so the caller can undo the placements. Returns False as soon as an
+    empty cell has no candidates.
+    """
+    row_of, col_of, box_of, bit_to_digit = ROW_OF, COL_OF, BOX_OF, BIT_TO_DIGIT
+    changed = True
+    while changed:
+        changed = False
+        for idx in cells:
+            if board[idx] == 0:
+                row, col, box = row_of[idx], col_of[idx], box_of[idx]
+                cand = ~(row_mask[row] | col_mask[col] | box_mask[box]) & 0x1FF
+                if cand == 0:
                     return False
+                if cand & (cand - 1) == 0:
+                    board[idx] = bit_to_digit[cand]
+                    row_mask[row] |= cand
+                    col_mask[col] |= cand
+                    box_mask[box] |= cand
+                    trail.append(idx)
+                    changed = True
+    return True
+
+def _solve_core(board, row_mask, col_mask, box_mask, limit, solutions=None):
+    """Count solutions of a flat board (up to limit) by iterative backtracking.
+    
+    Every node first fills the naked singles, then branches on the empty cell
+    with the fewest candidates. An explicit stack of (cell index, remaining
+    candidates, trail mark) keeps the whole search in a single frame over
+    plain ints; cells filled by propagation are recorded on the trail and
+    undone with the branch that produced them. Once limit is reached the
+    board is left holding the last solution found; otherwise every placement
+    is undone and the masks are restored.
+    
+    The search is specialized to the puzzle by listing its empty cells once,
+    so clues and fully given boxes are never rescanned. If a solutions list
+    is given, a copy of every solution found is appended to it.
+    """
+    if limit <= 0:
+        return 0
+    
+    row_of, col_of, box_of, popcount = ROW_OF, COL_OF, BOX_OF, POPCOUNT
+    digit_bit, bit_to_digit = DIGIT_BIT, BIT_TO_DIGIT
+    empties = [idx for idx in range(81) if board[idx] == 0]
+    found = 0
+    stack = []
+    trail = []
+    
+    while True:
+        if _propagate_singles(board, row_mask, col_mask, box_mask, trail, empties):
+            # Pick the most constrained empty cell
+            best = -1
+            best_count = 10
+            best_cand = 0
+            for idx in empties:
+                if board[idx] == 0:
+                    cand = ~(row_mask[row_of[idx]] | col_mask[col_of[idx]] | box_mask[box_of[idx]]) & 0x1FF
+                    count = popcount[cand]
+                    if count < best_count:
+                        best, best_count, best_cand = idx, count, cand
+                        if count <= 2:
+                            break
+            
+            if best < 0:
+                found += 1
+                if solutions is not None:
+                    solutions.append(board[:])
+                if found >= limit:
+                    return found
+            else:
+                stack.append((best, best_cand, len(trail)))
         
-        return True
+        # Backtrack until some cell still has an untried candidate
+        placed = False
+        while stack and not placed:
+            idx, cand, mark = stack.pop()
+            
+            while len(trail) > mark:
+                filled = trail.pop()
+                bit = digit_bit[board[filled]]
+                row_mask[row_of[filled]] ^= bit
+                col_mask[col_of[filled]] ^= bit
+                box_mask[box_of[filled]] ^= bit
+                board[filled] = 0
+            
+            row, col, box = row_of[idx], col_of[idx], box_of[idx]
+            num = board[idx]
+            if num:
+                bit = digit_bit[num]
+                row_mask[row] ^= bit
+                col_mask[col] ^= bit
+                box_mask[box] ^= bit
+                board[idx] = 0
+            
+            if cand:
+                bit = cand & -cand
+                board[idx] = bit_to_digit[bit]
+                row_mask[row] |= bit
+                col_mask[col] |= bit
+                box_mask[box] |= bit
+                stack.append((idx, cand ^ bit, mark))
+                placed = True
+        
+        if not placed:
+            # Search exhausted: also undo the singles filled at the root
+            for filled in trail:
+                bit = digit_bit[board[filled]]
+                row_mask[row_of[filled]] ^= bit
+                col_mask[col_of[filled]] ^= bit
+                box_mask[box_of[filled]] ^= bit
+                board[filled] = 0
+            return found
+
+class SmartSudokuSolver:
+    """Advanced Sudoku solver with comprehensive validation"""
     
     @staticmethod
-    def find_empty(board):
-        """Find next empty cell (0)"""
-        for i in range(9):
-            for j in range(9):
-                if board[i][j] == 0:
-                    return (i, j)
-        return None
+    def _init_masks(board):
+        """Build row, column and box bitmasks of the digits on a flat board"""
+        row_mask = [0] * 9
+        col_mask = [0] * 9
+        box_mask = [0] * 9
+        for idx in range(81):
+            num = board[idx]
+            if num != 0:
+                bit = DIGIT_BIT[num]
+                row_mask[ROW_OF[idx]] |= bit
+                col_mask[COL_OF[idx]] |= bit
+                box_mask[BOX_OF[idx]] |= bit
+        return row_mask, col_mask, box_mask
     
     @staticmethod
-    def solve(board):
-        """Solve sudoku using backtracking algorithm"""
-        empty = SmartSudokuSolver.find_empty(board)
-        if not empty:
-            return True
-        
-        row, col = empty
-        for num in range(1, 10):
-            if SmartSudokuSolver.is_valid_move(board, row, col, num):
-                board[row][col] = num
-                if SmartSudokuSolver.solve(board):
-                    return True
-                board[row][col] = 0
-        
-        return False
+    def solve(board, row_mask=None, col_mask=None, box_mask=None):
+        """Solve a flat sudoku board in place using backtracking"""
+        if row_mask is None:
+            row_mask, col_mask, box_mask = SmartSudokuSolver._init_masks(board)
+        
+        return _solve_core(board, row_mask, col_mask, box_mask, 1) == 1
     
     @staticmethod
     def is_valid_puzzle(board):
-        """Check if current puzzle state is valid (no conflicts)"""
-        for i in range(9):
-            for j in range(9):
-                if board[i][j] != 0:
-                    num = board[i][j]
-                    board[i][j] = 0
-                    valid = SmartSudokuSolver.is_valid_move(board, i, j, num)
-                    board[i][j] = num
-                    if not valid:
-                        return False
+        """Check if a flat puzzle state is valid (no conflicts)"""
+        row_mask = [0] * 9
+        col_mask = [0] * 9
+        box_mask = [0] * 9
+        for idx in range(81):
+            num = board[idx]
+            if num == 0:
+                continue
+            bit = DIGIT_BIT[num]
+            row, col, box = ROW_OF[idx], COL_OF[idx], BOX_OF[idx]
+            if (row_mask[row] | col_mask[col] | box_mask[box]) & bit:
+                return False
+            row_mask[row] |= bit
+            col_mask[col] |= bit
+            box_mask[box] |= bit
         return True
     
     @staticmethod
     def count_solutions(board, limit=2):
-        """Count number of solutions (up to limit)"""
+        """Count number of solutions of a flat board (up to limit)"""
+        board = board[:]
+        row_mask, col_mask, box_mask = SmartSudokuSolver._init_masks(board)
+        return _solve_core(board, row_mask, col_mask, box_mask, limit)
+    
+    @staticmethod
+    def find_solutions(board, limit=2):
+        """Return up to limit solutions of a flat board as flat bytearrays"""
         solutions = []
-        SmartSudokuSolver._find_all_solutions(copy.deepcopy(board), solutions, limit)
-        return len(solutions)
+        board = board[:]
+        row_mask, col_mask, box_mask = SmartSudokuSolver._init_masks(board)
+        _solve_core(board, row_mask, col_mask, box_mask, limit, solutions)
+        return solutions
     
     @staticmethod
-    def _find_all_solutions(board, solutions, max_solutions):
-        """Find all solutions up to max_solutions"""
-        if len(solutions) >= max_solutions:
-            return
-        
-        empty = SmartSudokuSolver.find_empty(board)
-        if not empty:
-            solutions.append(copy.deepcopy(board))
-            return
-        
-        row, col = empty
-        for num in range(1, 10):
-            if SmartSudokuSolver.is_valid_move(board, row, col, num):
-                board[row][col] = num
-                SmartSudokuSolver._find_all_solutions(board, solutions, max_solutions)
-                board[row][col] = 0
+    def is_forced(board, row_mask, col_mask, box_mask, idx, num):
+        """Check that num is the only digit at the empty cell idx that still
+        leads to a solution.
+        
+        Assumes the board with num placed at idx has a unique solution,
+        so the puzzle stays unique exactly when every other candidate for the
+        cell is a dead end. Each of those is refuted with a search that stops
+        at the first solution.
+        """
+        row, col, box = ROW_OF[idx], COL_OF[idx], BOX_OF[idx]
+        others = ~(row_mask[row] | col_mask[col] | box_mask[box] | DIGIT_BIT[num]) & 0x1FF
+        while others:
+            bit = others & -others
+            others ^= bit
+            
+            trial = board[:]
+            trial[idx] = BIT_TO_DIGIT[bit]
+            trial_rows, trial_cols, trial_boxes = row_mask[:], col_mask[:], box_mask[:]
+            trial_rows[row] |= bit
+            trial_cols[col] |= bit
+            trial_boxes[box] |= bit
+            
+            if _solve_core(trial, trial_rows, trial_cols, trial_boxes, 1):
+                return False
+        return True
 
 # ------------------- Puzzle Generator -------------------
 
+DIFFICULTY_LEVELS = {
+    "easy": 40,
+    "medium": 32,   
+    "hard": 26,     
+    "expert": 22
+}
+
+_ALL_CELLS = list(range(81))
+
 def generate_puzzle(difficulty="medium"):
     """Generate a valid sudoku puzzle with unique solution"""
-    difficulty_levels = {
-        "easy": 40,
-        "medium": 32,   
-        "hard": 26,     
-        "expert": 22
-    }
+    clues = DIFFICULTY_LEVELS.get(difficulty, 32)
     
-    clues = difficulty_levels.get(difficulty, 32)
-    
-    board = [[0 for _ in range(9)] for _ in range(9)]
+    board = bytearray(81)
     
+    nums = bytearray(b'\x01\x02\x03\x04\x05\x06\x07\x08\x09')
     for box in range(0, 9, 3):
-        nums = list(range(1, 10))
         random.shuffle(nums)
-        idx = 0
-        for i in range(3):
-            for j in range(3):
-                board[box + i][box + j] = nums[idx]
-                idx += 1
+        start = box * 9 + box
+        board[start:start + 3] = nums[0:3]
+        board[start + 9:start + 12] = nums[3:6]
+        board[start + 18:start + 21] = nums[6:9]
     
     SmartSudokuSolver.solve(board)
-    solution = copy.deepcopy(board)
+    solution = board[:]
     
-    cells = [(i, j) for i in range(9) for j in range(9)]
+    cells = _ALL_CELLS[:]
     random.shuffle(cells)
     
     removed = 0
     target_removed = 81 - clues
+    row_mask, col_mask, box_mask = SmartSudokuSolver._init_masks(board)
     
-    for i, j in cells:
+    for idx in cells:
         if removed >= target_removed:
             break
             
-        backup = board[i][j]
-        board[i][j] = 0
-        
-        if SmartSudokuSolver.count_solutions(board, 2) == 1:
+        row, col, box = ROW_OF[idx], COL_OF[idx], BOX_OF[idx]
+        backup = board[idx]
+        bit = DIGIT_BIT[backup]
+        board[idx] = 0
+        row_mask[row] ^= bit
+        col_mask[col] ^= bit
+        box_mask[box] ^= bit
+        
+        if SmartSudokuSolver.is_forced(board, row_mask, col_mask, box_mask, idx, backup):
             removed += 1
         else:
-            board[i][j] = backup
+            board[idx] = backup
+            row_mask[row] |= bit
+            col_mask[col] |= bit
+            box_mask[box] |= bit
     
-    return board, solution
+    return unflatten_board(board), unflatten_board(solution)
+
+# ------------------- Puzzle Pool -------------------
+
+# A few ready-made puzzles per difficulty so new games start instantly.
+# They are generated in worker processes so the work is not GIL-bound.
+_POOL_SIZE = 3
+_puzzle_pool = {difficulty: queue.Queue(maxsize=_POOL_SIZE) for difficulty in DIFFICULTY_LEVELS}
+_pool_executor = None
+
+def _seed_pool_worker():
+    """Give each worker process its own random stream"""
+    random.seed(os.urandom(16))
+
+def _collect_puzzle(difficulty, future):
+    """Move a finished puzzle into its difficulty's pool"""
+    if future.cancelled() or future.exception() is not None:
+        return
+    try:
+        _puzzle_pool[difficulty].put_nowait(future.result())
+    except queue.Full:
+        pass
+
+def _submit_puzzle(difficulty):
+    """Queue one puzzle of the given difficulty on the worker processes"""
+    try:
+        future = _pool_executor.submit(generate_puzzle, difficulty)
+    except RuntimeError:
+        # Executor already shut down
+        return
+    future.add_done_callback(lambda f: _collect_puzzle(difficulty, f))
+
+def start_puzzle_pool():
+    """Start the worker processes and fill every pool (once)"""
+    global _pool_executor
+    if _pool_executor is not None:
+        return
+    
+    workers = max(1, (os.cpu_count() or 2) - 1)
+    _pool_executor = concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_seed_pool_worker
+    )
+    for _ in range(_POOL_SIZE):
+        for difficulty in DIFFICULTY_LEVELS:
+            _submit_puzzle(difficulty)
+
+def stop_puzzle_pool():
+    """Shut down the worker processes without waiting for pending puzzles"""
+    global _pool_executor
+    if _pool_executor is not None:
+        _pool_executor.shutdown(wait=False, cancel_futures=True)
+        _pool_executor = None
+
+def generate_puzzle_cached(difficulty="medium"):
+    """Take a pre-generated puzzle from the pool, generating one if it is empty"""
+    pool = _puzzle_pool.get(difficulty)
+    if pool is None:
+        return generate_puzzle(difficulty)
+    
+    try:
+        puzzle = pool.get_nowait()
+    except queue.Empty:
+        puzzle = generate_puzzle(difficulty)
+    
+    if _pool_executor is not None:
+        _submit_puzzle(difficulty)
+    return puzzle
+
+# ------------------- Help Text -------------------
+
+HELP_CONTENT = """🎯 HOW TO PLAY SUDOKU
+
+📋 BASIC RULES:
+• Fill each row with numbers 1-9 (no duplicates)
+• Fill each column with numbers 1-9 (no duplicates)
+• Fill each 3×3 box with numbers 1-9 (no duplicates)
+
+🎮 NEW FEATURES:
+
+🎨 THEME CUSTOMIZATION:
+• Change background color independently
+• Change button colors separately
+• Personalize your gaming experience
+
+📥 DOWNLOAD SOLUTION:
+• Save completed puzzles as .txt files
+• Download full solution even if not complete
+• Includes formatted view and statistics
+
+🔍 AUTO-CHECK TOGGLE:
+• Turn ON: See colors (green=correct, yellow=valid, red=wrong)
+• Turn OFF: Play without hints, check at the end
+• Toggle anytime during gameplay
+
+⏰ CUSTOM COUNTDOWN:
+• Set your own countdown timer (1-60 minutes)
+• Choose Count Up, Count Down, or Free Play mode
+• Timer changes color as time runs out
+
+💡 SMART HINTS:
+• Hints target cells with fewest possibilities
+• Track hints used for scoring
+• Yellow highlight for hint cells
+
+🏆 DIFFICULTY LEVELS:
+• Easy: 40+ clues
+• Medium: 32+ clues
+• Hard: 26+ clues
+• Expert: 22+ clues
+
+📁 FILE FORMAT (.txt):
+• Exactly 81 digits in sequence
+• 0 = empty, 1-9 = filled
+• Example: 530070000600195000...
+
+⌨️ CONTROLS:
+• 1-9: Enter numbers
+• Backspace/Delete: Clear cell
+• Tab: Next cell
+
+🎓 CREATED BY:
+Mutaib • Andrie • Fawad
+Universitas Syiah Kuala © 2025"""
+
+# ------------------- Widget Helpers -------------------
+
+def _set_color(widget, bg, fg=None):
+    """Recolor a widget with one Tcl configure call, skipping Tkinter's option parsing"""
+    if fg is None:
+        widget.tk.call(widget._w, 'configure', '-bg', bg)
+    else:
+        widget.tk.call(widget._w, 'configure', '-bg', bg, '-fg', fg)
 
 # ------------------- Modern Button Class -------------------
 
@@ -180,7 +507,7 @@ class ModernButton(tk.Button):
         active_color = kwargs.pop('active_color', COLORS['primary_dark'])
         
         default_style = {
-            'font': ('Segoe UI', 10, 'bold'),
+            'font': BUTTON_FONT,
             'bg': bg_color,
             'fg': COLORS['white'],
             'bd': 0,
@@ -221,6 +548,24 @@ class SudokuGame:
         
         self.master.configure(bg=self.bg_color)
         
+        # Shared named fonts, created once and referenced by every widget
+        self.fonts = {
+            'normal_10': tkfont.Font(self.master, family='Segoe UI', size=10),
+            'bold_10': tkfont.Font(self.master, name=BUTTON_FONT, family='Segoe UI', size=10, weight='bold'),
+            'italic_10': tkfont.Font(self.master, family='Segoe UI', size=10, slant='italic'),
+            'normal_11': tkfont.Font(self.master, family='Segoe UI', size=11),
+            'bold_11': tkfont.Font(self.master, family='Segoe UI', size=11, weight='bold'),
+            'normal_12': tkfont.Font(self.master, family='Segoe UI', size=12),
+            'bold_12': tkfont.Font(self.master, family='Segoe UI', size=12, weight='bold'),
+            'normal_14': tkfont.Font(self.master, family='Segoe UI', size=14),
+            'bold_14': tkfont.Font(self.master, family='Segoe UI', size=14, weight='bold'),
+            'bold_16': tkfont.Font(self.master, family='Segoe UI', size=16, weight='bold'),
+            'bold_18': tkfont.Font(self.master, family='Segoe UI', size=18, weight='bold'),
+            'bold_20': tkfont.Font(self.master, family='Segoe UI', size=20, weight='bold'),
+            'bold_24': tkfont.Font(self.master, family='Segoe UI', size=24, weight='bold'),
+            'bold_28': tkfont.Font(self.master, family='Segoe UI', size=28, weight='bold'),
+        }
+        
         # Game settings
         self.auto_check = tk.BooleanVar(value=True)
         self.timer_mode = tk.StringVar(value="count_up")
@@ -228,22 +573,65 @@ class SudokuGame:
         
         # Game state
         self.difficulty = "medium"
-        self.puzzle, self.solution = generate_puzzle(self.difficulty)
-        self.original_puzzle = copy.deepcopy(self.puzzle)
-        self.user_puzzle = copy.deepcopy(self.puzzle)
+        # Shared by the Difficulty menu's radio entries, which mark the level
+        self.difficulty_var = tk.StringVar(value=self.difficulty)
+        self.puzzle, self.solution = generate_puzzle_cached(self.difficulty)
+        self.original_puzzle = tuple(tuple(row) for row in self.puzzle)
+        self.user_puzzle = [row[:] for row in self.puzzle]
+        self._reset_masks()
         self.cells = [[None for _ in range(9)] for _ in range(9)]
+        # Flat views of the board widgets, indexed by row * 9 + col, so hot
+        # loops never have to ask Tk for a cell's state
+        self.cell_flat = [None] * 81
+        self.is_readonly = [False] * 81
+        self._highlighted = set()
+        # after() ids of debounced cell validations, keyed by (row, col)
+        self._pending_validate = {}
         self.selected_cell = None
+        # Preview validation runs its solve here so the window stays live
+        self._exec = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._blinking = False
+        # Animations advance a step counter from one periodic after() tick;
+        # the ids of the pending ticks are kept so they can be cancelled
+        self._anim_colors = (COLORS['white'], '#FFD700', '#FFA500', '#FF6347', '#FFD700', COLORS['white'])
+        self._anim_label = None
+        self._anim_step = 0
+        self._anim_id = None
+        self._blink_colors = (COLORS['error'], COLORS['warning'])
+        self._blink_step = 0
+        self._blink_id = None
         self.game_completed = False
         self.hints_used = 0
         self.timer_seconds = 0
         self.timer_running = False
         self.start_time = time.time()
+        # Pending update_timer tick and the text and color the timer label
+        # last showed
+        self._timer_after_id = None
+        self._last_timer_text = None
+        self._timer_fg = None
+        self._timer_display = ("⏱ 00:00", None)
+        self._timer_visible = True
+        self._timer_handlers = {
+            "count_up": self._tick_up,
+            "count_down": self._tick_down,
+            "free": self._tick_free
+        }
+        self._timer_tick = self._tick_up
+        # Help dialog, created on first use and hidden rather than destroyed
+        self._help_window = None
         
         # Store button references for theme updates
         self.buttons = []
+        # Widgets drawn in the themeable background color
+        self._themed_frames = []
+        # (widget, options) pairs waiting for the next _flush_ui
+        self._pending_ui = []
         
         # Create UI
         self.create_ui()
+        self.master.bind('<Map>', self._on_map, add='+')
+        self.master.bind('<Unmap>', self._on_unmap, add='+')
         self.start_timer()
 
     def create_ui(self):
@@ -284,6 +672,7 @@ class SudokuGame:
         """Create header with title and stats"""
         header_frame = tk.Frame(self.scrollable_frame, bg=self.bg_color, pady=20)
         header_frame.pack(fill="x")
+        self._themed_frames.append(header_frame)
         
         title_frame = tk.Frame(header_frame, bg=self.button_color, relief='raised', bd=2)
         title_frame.pack(pady=(0, 15))
@@ -291,7 +680,7 @@ class SudokuGame:
         title_label = tk.Label(
             title_frame,
             text="🎯 SUDOKU MASTER",
-            font=('Segoe UI', 28, 'bold'),
+            font=self.fonts['bold_28'],
             fg=COLORS['white'],
             bg=self.button_color,
             pady=15
@@ -307,7 +696,7 @@ class SudokuGame:
         self.timer_label = tk.Label(
             stats_inner,
             text="⏱ 00:00",
-            font=('Segoe UI', 16, 'bold'),
+            font=self.fonts['bold_16'],
             fg=self.button_color,
             bg=COLORS['gray_100']
         )
@@ -315,8 +704,8 @@ class SudokuGame:
         
         self.difficulty_label = tk.Label(
             stats_inner,
-            text=f"📊 Level: {self.difficulty.title()}",
-            font=('Segoe UI', 14, 'bold'),
+            text=DIFFICULTY_LABELS[self.difficulty],
+            font=self.fonts['bold_14'],
             fg=COLORS['gray_700'],
             bg=COLORS['gray_100']
         )
@@ -325,7 +714,7 @@ class SudokuGame:
         self.hints_label = tk.Label(
             stats_inner,
             text=f"💡 Hints: {self.hints_used}",
-            font=('Segoe UI', 14, 'bold'),
+            font=self.fonts['bold_14'],
             fg=COLORS['gray_700'],
             bg=COLORS['gray_100']
         )
@@ -339,6 +728,10 @@ class SudokuGame:
         board_frame = tk.Frame(board_container, bg=COLORS['gray_800'], padx=6, pady=6)
         board_frame.pack()
         
+        self.master.bind_class('SudokuCell', '<KeyRelease>', self._on_cell_key_release)
+        self.master.bind_class('SudokuCell', '<FocusIn>', self._on_cell_focus_in)
+        self.master.bind_class('SudokuCell', '<FocusOut>', self._on_cell_focus_out)
+        
         for i in range(9):
             for j in range(9):
                 padx = (3, 3)
@@ -349,49 +742,51 @@ class SudokuGame:
                 if i % 3 == 2 and i != 8:
                     pady = (3, 8)
                 
+                value = self.puzzle[i][j]
+                
+                # All per-cell options go into the constructor so each cell
+                # costs a single Tk create call; clues only flip to readonly
                 entry = tk.Entry(
                     board_frame,
                     width=4,
-                    font=('Segoe UI', 24, 'bold'),
+                    font=self.fonts['bold_24'],
                     justify="center",
                     bd=3,
                     relief='solid',
                     highlightthickness=4,
                     highlightcolor=self.button_color,
-                    highlightbackground=COLORS['gray_300']
+                    highlightbackground=COLORS['gray_300'],
+                    bg=COLORS['white'],
+                    readonlybackground=COLORS['gray_200'],
+                    fg=COLORS['gray_900'] if value != 0 else self.button_color,
+                    insertbackground=self.button_color
                 )
                 
                 entry.grid(row=i, column=j, padx=padx, pady=pady, ipady=12)
                 
-                value = self.puzzle[i][j]
                 if value != 0:
                     entry.insert(0, str(value))
-                    entry.config(
-                        state="readonly",
-                        readonlybackground=COLORS['gray_200'],
-                        fg=COLORS['gray_900'],
-                        font=('Segoe UI', 24, 'bold')
-                    )
-                else:
-                    entry.config(
-                        bg=COLORS['white'], 
-                        fg=self.button_color,
-                        insertbackground=self.button_color
-                    )
-                    entry.bind('<KeyRelease>', lambda e, r=i, c=j: self.on_cell_change(r, c))
-                    entry.bind('<FocusIn>', lambda e, r=i, c=j: self.on_focus_in(r, c))
-                    entry.bind('<FocusOut>', lambda e, r=i, c=j: self.on_focus_out(r, c))
+                    entry.config(state="readonly")
+                
+                # Events reach the shared SudokuCell handlers, which read the
+                # cell position back from the widget
+                entry.row, entry.col = i, j
+                entry.bindtags(('SudokuCell',) + entry.bindtags())
                 
                 self.cells[i][j] = entry
+                self.cell_flat[i * 9 + j] = entry
+                self.is_readonly[i * 9 + j] = value != 0
 
     def create_control_panel(self):
         """Create control buttons and settings"""
         control_frame = tk.Frame(self.scrollable_frame, bg=self.bg_color)
         control_frame.pack(pady=20, fill="x", padx=20)
+        self._themed_frames.append(control_frame)
         
         # Game Control Buttons
         button_frame1 = tk.Frame(control_frame, bg=self.bg_color)
         button_frame1.pack(pady=5)
+        self._themed_frames.append(button_frame1)
         
         btn1 = ModernButton(
             button_frame1,
@@ -399,7 +794,7 @@ class SudokuGame:
             command=self.new_game,
             bg_color=COLORS['success'],
             hover_color='#047857',
-            font=('Segoe UI', 12, 'bold'),
+            font=self.fonts['bold_12'],
             pady=10,
             padx=20
         )
@@ -411,7 +806,7 @@ class SudokuGame:
             text="✅ Check Solution",
             command=self.check_solution,
             bg_color=self.button_color,
-            font=('Segoe UI', 12, 'bold'),
+            font=self.fonts['bold_12'],
             pady=10,
             padx=20
         )
@@ -423,7 +818,7 @@ class SudokuGame:
             text="🔍 Show Solution",
             command=self.show_solution,
             bg_color=COLORS['secondary'],
-            font=('Segoe UI', 12, 'bold'),
+            font=self.fonts['bold_12'],
             pady=10,
             padx=20
         )
@@ -435,7 +830,7 @@ class SudokuGame:
             text="💡 Get Hint",
             command=self.give_hint,
             bg_color=COLORS['warning'],
-            font=('Segoe UI', 12, 'bold'),
+            font=self.fonts['bold_12'],
             pady=10,
             padx=20
         )
@@ -445,13 +840,14 @@ class SudokuGame:
         # File and Utility Buttons
         button_frame2 = tk.Frame(control_frame, bg=self.bg_color)
         button_frame2.pack(pady=5)
+        self._themed_frames.append(button_frame2)
         
         btn5 = ModernButton(
             button_frame2,
             text="📁 Upload Puzzle",
             command=self.load_from_file,
             bg_color=COLORS['primary_dark'],
-            font=('Segoe UI', 12, 'bold'),
+            font=self.fonts['bold_12'],
             pady=10,
             padx=20
         )
@@ -463,7 +859,7 @@ class SudokuGame:
             text="💾 Save Puzzle",
             command=self.save_to_file,
             bg_color=COLORS['primary_dark'],
-            font=('Segoe UI', 12, 'bold'),
+            font=self.fonts['bold_12'],
             pady=10,
             padx=20
         )
@@ -475,7 +871,7 @@ class SudokuGame:
             text="📥 Download Solution",
             command=self.download_solution,
             bg_color=COLORS['success'],
-            font=('Segoe UI', 12, 'bold'),
+            font=self.fonts['bold_12'],
             pady=10,
             padx=20
         )
@@ -487,7 +883,7 @@ class SudokuGame:
             text="🗑 Clear Board",
             command=self.clear_board,
             bg_color=COLORS['gray_600'],
-            font=('Segoe UI', 12, 'bold'),
+            font=self.fonts['bold_12'],
             pady=10,
             padx=20
         )
@@ -497,13 +893,14 @@ class SudokuGame:
         # Theme Buttons
         button_frame3 = tk.Frame(control_frame, bg=self.bg_color)
         button_frame3.pack(pady=5)
+        self._themed_frames.append(button_frame3)
         
         btn9 = ModernButton(
             button_frame3,
             text="🎨 Change Background",
             command=self.change_bg_color,
             bg_color=COLORS['secondary'],
-            font=('Segoe UI', 12, 'bold'),
+            font=self.fonts['bold_12'],
             pady=10,
             padx=20
         )
@@ -515,7 +912,7 @@ class SudokuGame:
             text="🖌 Change Buttons",
             command=self.change_button_color,
             bg_color=COLORS['secondary'],
-            font=('Segoe UI', 12, 'bold'),
+            font=self.fonts['bold_12'],
             pady=10,
             padx=20
         )
@@ -527,7 +924,7 @@ class SudokuGame:
             text="❓ Help",
             command=self.show_help,
             bg_color=COLORS['gray_500'],
-            font=('Segoe UI', 12, 'bold'),
+            font=self.fonts['bold_12'],
             pady=10,
             padx=20
         )
@@ -540,7 +937,7 @@ class SudokuGame:
             text="⚙️ Game Settings", 
             bg=COLORS['gray_100'],
             fg=COLORS['gray_800'],
-            font=('Segoe UI', 12, 'bold'),
+            font=self.fonts['bold_12'],
             pady=10
         )
         settings_frame.pack(pady=15, fill="x")
@@ -557,7 +954,7 @@ class SudokuGame:
             text="🔍 Auto-check entries",
             variable=self.auto_check,
             command=self.toggle_auto_check,
-            font=('Segoe UI', 11),
+            font=self.fonts['normal_11'],
             bg=COLORS['gray_100'],
             activebackground=COLORS['gray_100'],
             fg=COLORS['gray_800']
@@ -570,7 +967,7 @@ class SudokuGame:
         tk.Label(
             timer_frame,
             text="⏱ Timer Mode:",
-            font=('Segoe UI', 11, 'bold'),
+            font=self.fonts['bold_11'],
             bg=COLORS['gray_100'],
             fg=COLORS['gray_800']
         ).pack(anchor="w")
@@ -583,7 +980,7 @@ class SudokuGame:
                 variable=self.timer_mode,
                 value=mode,
                 command=self.reset_timer,
-                font=('Segoe UI', 10),
+                font=self.fonts['normal_10'],
                 bg=COLORS['gray_100'],
                 activebackground=COLORS['gray_100'],
                 fg=COLORS['gray_700']
@@ -596,7 +993,7 @@ class SudokuGame:
         tk.Label(
             countdown_frame,
             text="⏰ Countdown Minutes:",
-            font=('Segoe UI', 11, 'bold'),
+            font=self.fonts['bold_11'],
             bg=COLORS['gray_100'],
             fg=COLORS['gray_800']
         ).pack(anchor="w")
@@ -607,7 +1004,7 @@ class SudokuGame:
             to=60,
             textvariable=self.countdown_minutes,
             width=10,
-            font=('Segoe UI', 10),
+            font=self.fonts['normal_10'],
             command=self.update_countdown_time
         )
         timer_spinbox.pack(anchor="w", pady=5)
@@ -615,34 +1012,39 @@ class SudokuGame:
         # Difficulty Selection
         diff_frame = tk.Frame(control_frame, bg=self.bg_color)
         diff_frame.pack(pady=10)
+        self._themed_frames.append(diff_frame)
         
-        tk.Label(
+        diff_label = tk.Label(
             diff_frame,
             text="🎚 Difficulty Level:",
-            font=('Segoe UI', 12, 'bold'),
+            font=self.fonts['bold_12'],
             bg=self.bg_color,
             fg=COLORS['gray_800']
-        ).pack()
+        )
+        diff_label.pack()
+        self._themed_frames.append(diff_label)
         
         diff_buttons = tk.Frame(diff_frame, bg=self.bg_color)
         diff_buttons.pack(pady=5)
+        self._themed_frames.append(diff_buttons)
         
-        difficulty_info = {
-            "easy": ("😊 Easy", COLORS['success']),
-            "medium": ("🙂 Medium", COLORS['warning']),
-            "hard": ("😤 Hard", COLORS['error']),
-            "expert": ("🤯 Expert", COLORS['gray_800'])
+        difficulty_text = {
+            "easy": "😊 Easy",
+            "medium": "🙂 Medium",
+            "hard": "😤 Hard",
+            "expert": "🤯 Expert"
         }
         
         self.diff_buttons_refs = {}
-        for diff, (text, color) in difficulty_info.items():
+        for diff, color in DIFFICULTY_COLORS.items():
+            text = difficulty_text[diff]
             bg_color = color if diff == self.difficulty else COLORS['gray_400']
             btn = ModernButton(
                 diff_buttons,
                 text=text,
-                command=lambda d=diff: self.change_difficulty(d),
+                command=functools.partial(self.change_difficulty, diff),
                 bg_color=bg_color,
-                font=('Segoe UI', 10, 'bold'),
+                font=self.fonts['bold_10'],
                 pady=6,
                 padx=12
             )
@@ -653,13 +1055,14 @@ class SudokuGame:
         """Create footer"""
         footer_frame = tk.Frame(self.scrollable_frame, bg=self.bg_color)
         footer_frame.pack(fill="x", pady=20)
+        self._themed_frames.append(footer_frame)
         
         info_frame = tk.LabelFrame(
             footer_frame,
             text="📋 File Format Instructions",
             bg=COLORS['blue_light'],
             fg=COLORS['primary_dark'],
-            font=('Segoe UI', 11, 'bold')
+            font=self.fonts['bold_11']
         )
         info_frame.pack(fill="x", padx=20, pady=10)
         
@@ -674,7 +1077,7 @@ class SudokuGame:
         tk.Label(
             info_frame,
             text=instruction_text,
-            font=('Segoe UI', 10),
+            font=self.fonts['normal_10'],
             fg=COLORS['primary_dark'],
             bg=COLORS['blue_light'],
             justify="left"
@@ -686,7 +1089,7 @@ class SudokuGame:
         tk.Label(
             credits_frame,
             text="✨ Crafted with Precision & Passion ✨",
-            font=('Segoe UI', 12, 'bold'),
+            font=self.fonts['bold_12'],
             fg=COLORS['white'],
             bg=self.button_color
         ).pack(pady=(15, 5))
@@ -694,7 +1097,7 @@ class SudokuGame:
         tk.Label(
             credits_frame,
             text="👨‍💻 MUTAIB • ANDRIE • FAWAD 👨‍💻",
-            font=('Segoe UI', 16, 'bold'),
+            font=self.fonts['bold_16'],
             fg=COLORS['white'],
             bg=self.button_color
         ).pack(pady=5)
@@ -702,7 +1105,7 @@ class SudokuGame:
         tk.Label(
             credits_frame,
             text="🏛 Universitas Syiah Kuala © 2025 🏛",
-            font=('Segoe UI', 12),
+            font=self.fonts['normal_12'],
             fg=COLORS['gray_200'],
             bg=self.button_color
         ).pack(pady=(5, 15))
@@ -713,20 +1116,20 @@ class SudokuGame:
             # Clear all color coding when turned off
             for i in range(9):
                 for j in range(9):
-                    if self.cells[i][j]['state'] != 'readonly':
-                        self.cells[i][j].config(bg=COLORS['white'])
+                    if not self.is_readonly[i * 9 + j]:
+                        _set_color(self.cells[i][j], COLORS['white'])
         else:
             # Revalidate all cells when turned on
             for i in range(9):
                 for j in range(9):
-                    if self.cells[i][j]['state'] != 'readonly':
-                        val = self.cells[i][j].get()
-                        if val and val.isdigit():
-                            self.validate_cell(i, j, int(val))
+                    if not self.is_readonly[i * 9 + j] and self.user_puzzle[i][j]:
+                        self.validate_cell(i, j, self.user_puzzle[i][j])
 
     def update_countdown_time(self):
         """Update countdown time when spinbox changes"""
-        if self.timer_mode.get() == "count_down":
+        # The active tick handler already records the mode, so the
+        # timer_mode variable is only read again inside reset_timer
+        if self._timer_tick == self._tick_down:
             self.reset_timer()
 
     def change_bg_color(self):
@@ -749,32 +1152,19 @@ class SudokuGame:
         self.main_canvas.configure(bg=self.bg_color)
         self.scrollable_frame.configure(bg=self.bg_color)
         
-        # Update all frames recursively
-        for widget in self.scrollable_frame.winfo_children():
-            self.update_widget_bg(widget)
-
-    def update_widget_bg(self, widget):
-        """Recursively update widget backgrounds"""
-        try:
-            if isinstance(widget, (tk.Frame,)) and widget.cget('bg') not in [COLORS['gray_100'], COLORS['blue_light'], COLORS['gray_800']]:
-                widget.configure(bg=self.bg_color)
-            if isinstance(widget, tk.Label) and widget.cget('bg') == COLORS['white']:
-                widget.configure(bg=self.bg_color)
-        except:
-            pass
-        
-        for child in widget.winfo_children():
-            self.update_widget_bg(child)
+        for widget in self._themed_frames:
+            widget.configure(bg=self.bg_color)
 
     def apply_button_theme(self):
         """Apply button color theme"""
-        # Update timer label color
-        self.timer_label.configure(fg=self.button_color)
+        # Update timer label color unless it shows a status or threshold color
+        if self._timer_display[1] is None:
+            self._set_timer_text(*self._timer_display)
         
         # Update cell highlight colors
         for i in range(9):
             for j in range(9):
-                if self.cells[i][j]['state'] != 'readonly':
+                if not self.is_readonly[i * 9 + j]:
                     self.cells[i][j].configure(
                         fg=self.button_color,
                         insertbackground=self.button_color,
@@ -782,20 +1172,30 @@ class SudokuGame:
                     )
         
         # Update difficulty buttons to maintain proper colors
-        difficulty_info = {
-            "easy": COLORS['success'],
-            "medium": COLORS['warning'],
-            "hard": COLORS['error'],
-            "expert": COLORS['gray_800']
-        }
-        
+        self._recolor_difficulty_buttons()
+
+    def _recolor_difficulty_buttons(self):
+        """Show the selected difficulty in its color and grey out the rest"""
         for diff, (btn, orig_color) in self.diff_buttons_refs.items():
-            if diff == self.difficulty:
-                btn.config(bg=orig_color)
-                btn.bg_color = orig_color
-            else:
-                btn.config(bg=COLORS['gray_400'])
-                btn.bg_color = COLORS['gray_400']
+            color = orig_color if diff == self.difficulty else COLORS['gray_400']
+            # bg_color is the button's resting color, so an unchanged button
+            # costs no Tk call
+            if btn.bg_color != color:
+                self._queue_config(btn, bg=color)
+                btn.bg_color = color
+
+    def _queue_config(self, widget, **options):
+        """Configure a widget from the next idle callback, batched with others"""
+        if not self._pending_ui:
+            self.master.after_idle(self._flush_ui)
+        self._pending_ui.append((widget, options))
+
+    def _flush_ui(self):
+        """Apply every queued widget configuration in one pass"""
+        pending, self._pending_ui = self._pending_ui, []
+        for widget, options in pending:
+            if widget.winfo_exists():
+                widget.configure(**options)
 
     def download_solution(self):
         """Download the solved puzzle as .txt file"""
@@ -872,50 +1272,154 @@ class SudokuGame:
         except Exception as e:
             messagebox.showerror("❌ Download Error", f"Failed to save solution:\n{str(e)}")
 
+    def _on_cell_key_release(self, event):
+        """Dispatch a key release on a board cell"""
+        cell = event.widget
+        if not self.is_readonly[cell.row * 9 + cell.col]:
+            self.on_cell_change(cell.row, cell.col)
+
+    def _on_cell_focus_in(self, event):
+        """Dispatch focus entering a board cell"""
+        cell = event.widget
+        if not self.is_readonly[cell.row * 9 + cell.col]:
+            self.on_focus_in(cell.row, cell.col)
+
+    def _on_cell_focus_out(self, event):
+        """Dispatch focus leaving a board cell"""
+        cell = event.widget
+        if not self.is_readonly[cell.row * 9 + cell.col]:
+            self.on_focus_out(cell.row, cell.col)
+
+    def _reset_masks(self):
+        """Rebuild the digit masks and counts from user_puzzle"""
+        # Bit d-1 of a mask is set while digit d is present in that row,
+        # column or box. Players can enter duplicates, so each of the 27
+        # units (rows, columns 9-17, boxes 18-26) also counts every digit.
+        self.row_mask = [0] * 9
+        self.col_mask = [0] * 9
+        self.box_mask = [0] * 9
+        self._unit_counts = [[0] * 10 for _ in range(27)]
+        for i in range(9):
+            for j in range(9):
+                if self.user_puzzle[i][j] != 0:
+                    self._add_digit(i, j, self.user_puzzle[i][j])
+
+    def _add_digit(self, row, col, num):
+        """Count num as present at (row, col) in the masks"""
+        box = BOX_OF[row * 9 + col]
+        bit = DIGIT_BIT[num]
+        counts = self._unit_counts
+        counts[row][num] += 1
+        counts[9 + col][num] += 1
+        counts[18 + box][num] += 1
+        self.row_mask[row] |= bit
+        self.col_mask[col] |= bit
+        self.box_mask[box] |= bit
+
+    def _remove_digit(self, row, col, num):
+        """Drop num at (row, col) from the masks"""
+        box = BOX_OF[row * 9 + col]
+        bit = DIGIT_BIT[num]
+        counts = self._unit_counts
+        counts[row][num] -= 1
+        counts[9 + col][num] -= 1
+        counts[18 + box][num] -= 1
+        if not counts[row][num]:
+            self.row_mask[row] ^= bit
+        if not counts[9 + col][num]:
+            self.col_mask[col] ^= bit
+        if not counts[18 + box][num]:
+            self.box_mask[box] ^= bit
+
+    def _set_cell_value(self, row, col, num):
+        """Store num (0 for empty) in user_puzzle, keeping the masks in step"""
+        old = self.user_puzzle[row][col]
+        if old == num:
+            return
+        if old != 0:
+            self._remove_digit(row, col, old)
+        self.user_puzzle[row][col] = num
+        if num != 0:
+            self._add_digit(row, col, num)
+
+    def _is_valid_entry(self, row, col, num):
+        """Check that num at (row, col) clashes with no other cell"""
+        own = 1 if self.user_puzzle[row][col] == num else 0
+        counts = self._unit_counts
+        return (counts[row][num] == own and
+                counts[9 + col][num] == own and
+                counts[18 + BOX_OF[row * 9 + col]][num] == own)
+
     def on_cell_change(self, row, col):
         """Handle cell value changes with intelligent validation"""
         entry = self.cells[row][col]
         val = entry.get()
         
         if val == "":
-            self.user_puzzle[row][col] = 0
+            self._set_cell_value(row, col, 0)
             entry.config(bg=COLORS['white'])
-            return
-        
-        if not val.isdigit() or val == "0" or len(val) > 1:
+        elif not val.isdigit() or val == "0" or len(val) > 1:
             entry.delete(0, tk.END)
             if self.user_puzzle[row][col] != 0:
                 entry.insert(0, str(self.user_puzzle[row][col]))
             return
+        else:
+            self._set_cell_value(row, col, int(val))
+        
+        # The board model is updated at once; coloring and the completion
+        # check wait until typing in this cell pauses
+        pending = self._pending_validate.pop((row, col), None)
+        if pending is not None:
+            self.master.after_cancel(pending)
+        self._pending_validate[(row, col)] = self.master.after(50, self._validate_after_edit, row, col)
+
+    def _validate_after_edit(self, row, col):
+        """Color an edited cell and its peers, then check for completion"""
+        self._pending_validate.pop((row, col), None)
+        num = self.user_puzzle[row][col]
+        auto_check = self.auto_check.get()
+        
+        if num == 0:
+            if auto_check:
+                self._revalidate_peers(row, col)
+            return
         
-        num = int(val)
-        self.user_puzzle[row][col] = num
-        
-        if self.auto_check.get():
+        if auto_check:
             self.validate_cell(row, col, num)
+            self._revalidate_peers(row, col)
         else:
-            entry.config(bg=COLORS['white'])
+            self.cells[row][col].config(bg=COLORS['white'])
         
-        if self.is_puzzle_complete():
-            self.on_puzzle_complete()
+        if self.is_puzzle_complete() and not self.game_completed:
+            # Let Tk draw the final digit before the celebration grabs focus
+            self.master.after_idle(self.on_puzzle_complete)
+
+    def _cancel_pending_validation(self):
+        """Drop validations scheduled for the previous board"""
+        for after_id in self._pending_validate.values():
+            self.master.after_cancel(after_id)
+        self._pending_validate.clear()
+
+    def _revalidate_peers(self, row, col):
+        """Refresh the colors of filled peers, whose conflicts may have changed"""
+        for k in PEERS[row * 9 + col]:
+            if not self.is_readonly[k]:
+                num = self.user_puzzle[ROW_OF[k]][COL_OF[k]]
+                if num:
+                    self.validate_cell(ROW_OF[k], COL_OF[k], num)
 
     def validate_cell(self, row, col, num):
         """Validate a single cell and apply appropriate color coding"""
         entry = self.cells[row][col]
         
         if num == self.solution[row][col]:
-            entry.config(bg=COLORS['correct'], fg=COLORS['gray_900'])
+            _set_color(entry, COLORS['correct'], COLORS['gray_900'])
             return
         
-        temp_val = self.user_puzzle[row][col]
-        self.user_puzzle[row][col] = 0
-        
-        if SmartSudokuSolver.is_valid_move(self.user_puzzle, row, col, num):
-            entry.config(bg=COLORS['warning_light'], fg=COLORS['gray_800'])
+        if self._is_valid_entry(row, col, num):
+            _set_color(entry, COLORS['warning_light'], COLORS['gray_800'])
         else:
-            entry.config(bg=COLORS['error_light'], fg=COLORS['error'])
-        
-        self.user_puzzle[row][col] = temp_val
+            _set_color(entry, COLORS['error_light'], COLORS['error'])
 
     def on_focus_in(self, row, col):
         """Handle cell focus with visual feedback"""
@@ -925,40 +1429,42 @@ class SudokuGame:
     def on_focus_out(self, row, col):
         """Handle cell focus out"""
         if self.auto_check.get():
-            val = self.cells[row][col].get()
-            if val and val.isdigit():
-                self.validate_cell(row, col, int(val))
+            num = self.user_puzzle[row][col]
+            if num:
+                self.validate_cell(row, col, num)
         self.clear_highlights()
 
     def highlight_related_cells(self, row, col):
         """Highlight related cells"""
-        for i in range(9):
-            for j in range(9):
-                if self.cells[i][j]['state'] != 'readonly':
-                    if i == row or j == col or (i//3 == row//3 and j//3 == col//3):
-                        if (i, j) != (row, col):
-                            current_bg = self.cells[i][j]['bg']
-                            if current_bg == COLORS['white']:
-                                self.cells[i][j].config(bg=COLORS['gray_100'])
+        # Editable cells are plain white unless auto-check has colored a value
+        auto_check = self.auto_check.get()
+        highlighted = {
+            k for k in PEERS[row * 9 + col]
+            if not self.is_readonly[k] and (not auto_check or self.user_puzzle[ROW_OF[k]][COL_OF[k]] == 0)
+        }
+        # Only cells whose highlight state changes are sent to Tk
+        for k in self._highlighted - highlighted:
+            _set_color(self.cell_flat[k], COLORS['white'])
+        for k in highlighted - self._highlighted:
+            _set_color(self.cell_flat[k], COLORS['gray_100'])
+        self._highlighted = highlighted
 
     def clear_highlights(self):
         """Clear cell highlights"""
-        for i in range(9):
-            for j in range(9):
-                if self.cells[i][j]['state'] != 'readonly':
-                    val = self.cells[i][j].get()
-                    if val and val.isdigit() and self.auto_check.get():
-                        self.validate_cell(i, j, int(val))
-                    else:
-                        self.cells[i][j].config(bg=COLORS['white'])
+        # Highlighted cells were plain white; one may have been filled in by
+        # a hint since, in which case it gets its validation color back
+        auto_check = self.auto_check.get()
+        for k in self._highlighted:
+            num = self.user_puzzle[ROW_OF[k]][COL_OF[k]]
+            if num and auto_check:
+                self.validate_cell(ROW_OF[k], COL_OF[k], num)
+            else:
+                _set_color(self.cell_flat[k], COLORS['white'])
+        self._highlighted = set()
 
     def is_puzzle_complete(self):
         """Check if puzzle is completely and correctly solved"""
-        for i in range(9):
-            for j in range(9):
-                if self.user_puzzle[i][j] != self.solution[i][j]:
-                    return False
-        return True
+        return self.user_puzzle == self.solution
 
     def on_puzzle_complete(self):
         """Handle puzzle completion with animation"""
@@ -966,7 +1472,7 @@ class SudokuGame:
             return
             
         self.game_completed = True
-        self.timer_running = False
+        self._stop_timer()
         
         # Create celebration window with animation
         celebration_window = tk.Toplevel(self.master)
@@ -976,6 +1482,7 @@ class SudokuGame:
         celebration_window.resizable(False, False)
         celebration_window.transient(self.master)
         celebration_window.grab_set()
+        celebration_window.bind('<Destroy>', self._stop_celebration)
         
         # Center window
         celebration_window.update_idletasks()
@@ -987,14 +1494,14 @@ class SudokuGame:
         congrats_label = tk.Label(
             celebration_window,
             text="🎉 CONGRATULATIONS! 🎉",
-            font=('Segoe UI', 24, 'bold'),
+            font=self.fonts['bold_24'],
             fg=COLORS['white'],
             bg=COLORS['success']
         )
         congrats_label.pack(pady=30)
         
         # Animate the text
-        self.animate_celebration(congrats_label, 0)
+        self.animate_celebration(congrats_label)
         
         # Stats
         time_str = self.timer_label.cget("text").replace("⏱ ", "")
@@ -1021,7 +1528,7 @@ class SudokuGame:
         tk.Label(
             stats_frame,
             text=stats_text,
-            font=('Segoe UI', 14),
+            font=self.fonts['normal_14'],
             fg=COLORS['gray_800'],
             bg=COLORS['white'],
             justify='center'
@@ -1036,7 +1543,7 @@ class SudokuGame:
             text="🆕 New Game",
             command=lambda: [celebration_window.destroy(), self.new_game()],
             bg_color=COLORS['primary'],
-            font=('Segoe UI', 12, 'bold')
+            font=self.fonts['bold_12']
         ).pack(side="left", padx=10)
         
         ModernButton(
@@ -1044,7 +1551,7 @@ class SudokuGame:
             text="📥 Download Solution",
             command=lambda: [celebration_window.destroy(), self.download_solution()],
             bg_color=COLORS['secondary'],
-            font=('Segoe UI', 12, 'bold')
+            font=self.fonts['bold_12']
         ).pack(side="left", padx=10)
         
         ModernButton(
@@ -1052,48 +1559,72 @@ class SudokuGame:
             text="✅ Close",
             command=celebration_window.destroy,
             bg_color=COLORS['gray_600'],
-            font=('Segoe UI', 12, 'bold')
+            font=self.fonts['bold_12']
         ).pack(side="left", padx=10)
 
-    def animate_celebration(self, label, step):
+    def animate_celebration(self, label):
         """Animate celebration text"""
-        colors = [COLORS['white'], '#FFD700', '#FFA500', '#FF6347', '#FFD700', COLORS['white']]
-        if label.winfo_exists():
-            label.config(fg=colors[step % len(colors)])
-            self.master.after(200, lambda: self.animate_celebration(label, step + 1))
+        self._stop_celebration()
+        self._anim_label = label
+        self._anim_step = 0
+        self._tick_anim()
+
+    def _tick_anim(self):
+        """Show the next celebration color and schedule the following one"""
+        label = self._anim_label
+        if label is None or not label.winfo_exists():
+            self._anim_id = None
+            return
+        label.config(fg=self._anim_colors[self._anim_step % len(self._anim_colors)])
+        self._anim_step += 1
+        self._anim_id = self.master.after(200, self._tick_anim)
+
+    def _stop_celebration(self, event=None):
+        """Cancel the pending celebration animation step"""
+        self._anim_label = None
+        if self._anim_id is not None:
+            self.master.after_cancel(self._anim_id)
+            self._anim_id = None
 
     def check_solution(self):
         """Comprehensive solution validation"""
         conflicts = []
         incorrect = []
+        correct = []
         empty_cells = []
         
-        validation_board = copy.deepcopy(self.user_puzzle)
+        # Bitmask of the digits that occur more than once in each unit, so a
+        # cell is in conflict when its digit's bit is set in any of its units
+        dup_mask = [0] * 27
+        for unit, counts in enumerate(self._unit_counts):
+            for num in range(1, 10):
+                if counts[num] > 1:
+                    dup_mask[unit] |= DIGIT_BIT[num]
         
+        # user_puzzle mirrors every cell, so no Entry has to be read back
         for i in range(9):
             for j in range(9):
-                val = self.cells[i][j].get()
+                num = self.user_puzzle[i][j]
                 
-                if not val or val == "0":
+                if num == 0:
                     empty_cells.append((i, j))
                     continue
-                    
-                if not val.isdigit():
-                    continue
-                    
-                num = int(val)
                 
-                validation_board[i][j] = 0
-                if not SmartSudokuSolver.is_valid_move(validation_board, i, j, num):
+                if DIGIT_BIT[num] & (dup_mask[i] | dup_mask[9 + j] | dup_mask[18 + BOX_OF[i * 9 + j]]):
                     conflicts.append((i, j))
-                    self.cells[i][j].config(bg=COLORS['error_light'], fg=COLORS['error'])
                 elif num != self.solution[i][j]:
                     incorrect.append((i, j))
-                    self.cells[i][j].config(bg=COLORS['warning_light'], fg=COLORS['gray_800'])
                 else:
-                    self.cells[i][j].config(bg=COLORS['correct'], fg=COLORS['gray_900'])
-                
-                validation_board[i][j] = num
+                    correct.append((i, j))
+        
+        # Recolor bucket by bucket once the scan is done
+        for bucket, bg, fg in (
+            (conflicts, COLORS['error_light'], COLORS['error']),
+            (incorrect, COLORS['warning_light'], COLORS['gray_800']),
+            (correct, COLORS['correct'], COLORS['gray_900'])
+        ):
+            for i, j in bucket:
+                _set_color(self.cells[i][j], bg, fg)
         
         if conflicts:
             messagebox.showerror(
@@ -1127,15 +1658,15 @@ class SudokuGame:
             "This will reveal the entire solution and end the current game.\n\n"
             "Are you sure you want to continue?"
         ):
-            self.timer_running = False
+            self._stop_timer()
             
             for i in range(9):
                 for j in range(9):
-                    if self.cells[i][j]['state'] != 'readonly':
+                    if not self.is_readonly[i * 9 + j]:
                         self.cells[i][j].delete(0, tk.END)
                         self.cells[i][j].insert(0, str(self.solution[i][j]))
-                        self.cells[i][j].config(bg=COLORS['cyan_light'], fg=COLORS['gray_900'])
-                        self.user_puzzle[i][j] = self.solution[i][j]
+                        _set_color(self.cells[i][j], COLORS['cyan_light'], COLORS['gray_900'])
+                        self._set_cell_value(i, j, self.solution[i][j])
             
             messagebox.showinfo(
                 "✅ Solution Revealed", 
@@ -1156,14 +1687,15 @@ class SudokuGame:
         min_possibilities = 10
         
         for i, j in empty_cells:
-            possibilities = 0
-            for num in range(1, 10):
-                if SmartSudokuSolver.is_valid_move(self.user_puzzle, i, j, num):
-                    possibilities += 1
+            cand = ~(self.row_mask[i] | self.col_mask[j] | self.box_mask[BOX_OF[i * 9 + j]]) & 0x1FF
+            possibilities = POPCOUNT[cand]
             
             if 0 < possibilities < min_possibilities:
                 min_possibilities = possibilities
                 best_cell = (i, j)
+                if possibilities == 1:
+                    # A naked single cannot be beaten
+                    break
         
         if best_cell:
             i, j = best_cell
@@ -1172,7 +1704,10 @@ class SudokuGame:
             self.cells[i][j].delete(0, tk.END)
             self.cells[i][j].insert(0, str(correct_value))
             self.cells[i][j].config(bg=COLORS['hint_bg'], fg=COLORS['gray_900'])
-            self.user_puzzle[i][j] = correct_value
+            self._set_cell_value(i, j, correct_value)
+            # The hint may clash with entries in its row, column or box
+            if self.auto_check.get():
+                self._revalidate_peers(i, j)
             
             self.hints_used += 1
             self.hints_label.config(text=f"💡 Hints: {self.hints_used}")
@@ -1195,10 +1730,10 @@ class SudokuGame:
         ):
             for i in range(9):
                 for j in range(9):
-                    if self.cells[i][j]['state'] != 'readonly':
+                    if not self.is_readonly[i * 9 + j]:
                         self.cells[i][j].delete(0, tk.END)
-                        self.cells[i][j].config(bg=COLORS['white'])
-                        self.user_puzzle[i][j] = 0
+                        _set_color(self.cells[i][j], COLORS['white'])
+                        self._set_cell_value(i, j, 0)
             
             self.game_completed = False
 
@@ -1216,7 +1751,7 @@ class SudokuGame:
             with open(file_path, 'r') as file:
                 content = file.read().strip()
             
-            digits = ''.join(c for c in content if c.isdigit())
+            digits = _NONDIGIT.sub('', content)
             
             if len(digits) != 81:
                 messagebox.showerror(
@@ -1226,16 +1761,8 @@ class SudokuGame:
                 )
                 return
             
-            preview_puzzle = []
-            for i in range(9):
-                row = []
-                for j in range(9):
-                    digit = int(digits[i * 9 + j])
-                    if digit < 0 or digit > 9:
-                        messagebox.showerror("❌ Invalid Digit", f"Found invalid digit: {digit}")
-                        return
-                    row.append(digit)
-                preview_puzzle.append(row)
+            values = digits.encode('ascii').translate(_DIGIT_VALUES)
+            preview_puzzle = [list(values[i:i + 9]) for i in range(0, 81, 9)]
             
             self.show_puzzle_preview(preview_puzzle, file_path)
             
@@ -1253,6 +1780,7 @@ class SudokuGame:
         preview_window.resizable(False, False)
         preview_window.transient(self.master)
         preview_window.grab_set()
+        preview_window.bind('<Destroy>', self._stop_blinking)
         
         preview_window.update_idletasks()
         x = (preview_window.winfo_screenwidth() // 2) - 350
@@ -1265,7 +1793,7 @@ class SudokuGame:
         tk.Label(
             header_frame,
             text="📋 PUZZLE PREVIEW",
-            font=('Segoe UI', 18, 'bold'),
+            font=self.fonts['bold_18'],
             fg=COLORS['white'],
             bg=COLORS['primary'],
             pady=15
@@ -1293,7 +1821,7 @@ class SudokuGame:
                     inner_board,
                     text=str(preview_puzzle[i][j]) if preview_puzzle[i][j] != 0 else "",
                     width=3,
-                    font=('Segoe UI', 14, 'bold'),
+                    font=self.fonts['bold_14'],
                     bg=COLORS['gray_100'] if preview_puzzle[i][j] != 0 else COLORS['white'],
                     fg=COLORS['gray_900'] if preview_puzzle[i][j] != 0 else COLORS['gray_400'],
                     relief='solid',
@@ -1310,7 +1838,7 @@ class SudokuGame:
             text="🔍 VALIDATE PUZZLE",
             command=lambda: self.validate_preview_puzzle(preview_puzzle, preview_cells, validation_frame, preview_window, file_path),
             bg_color=COLORS['warning'],
-            font=('Segoe UI', 14, 'bold'),
+            font=self.fonts['bold_14'],
             pady=12,
             padx=30
         )
@@ -1322,7 +1850,7 @@ class SudokuGame:
             validation_frame,
             text="⚠️ Please validate the puzzle before loading!\n"
                  "This will check for rule violations and solvability.",
-            font=('Segoe UI', 12),
+            font=self.fonts['normal_12'],
             fg=COLORS['gray_700'],
             bg=COLORS['white'],
             justify='center'
@@ -1332,22 +1860,38 @@ class SudokuGame:
         file_info = tk.Label(
             validation_frame,
             text=f"📁 File: {file_path}",
-            font=('Segoe UI', 10),
+            font=self.fonts['normal_10'],
             fg=COLORS['gray_600'],
             bg=COLORS['white']
         )
         file_info.pack(pady=5)
 
     def blink_validation_button(self):
-        """Blink validation button"""
-        if hasattr(self, 'validation_button') and self.validation_button.winfo_exists():
-            current_color = self.validation_button['bg']
-            new_color = COLORS['error'] if current_color == COLORS['warning'] else COLORS['warning']
-            self.validation_button.config(bg=new_color)
-            self.master.after(500, self.blink_validation_button)
+        """Blink validation button until validation starts"""
+        self._stop_blinking()
+        self._blinking = True
+        self._blink_step = 0
+        self._tick_blink()
+
+    def _tick_blink(self):
+        """Show the next blink color and schedule the following one"""
+        if not self._blinking or not (hasattr(self, 'validation_button') and self.validation_button.winfo_exists()):
+            self._blink_id = None
+            return
+        self.validation_button.config(bg=self._blink_colors[self._blink_step % 2])
+        self._blink_step += 1
+        self._blink_id = self.master.after(500, self._tick_blink)
+
+    def _stop_blinking(self, event=None):
+        """Stop the validation button blink and cancel its pending step"""
+        self._blinking = False
+        if self._blink_id is not None:
+            self.master.after_cancel(self._blink_id)
+            self._blink_id = None
 
     def validate_preview_puzzle(self, preview_puzzle, preview_cells, validation_frame, preview_window, file_path):
         """Validate the preview puzzle"""
+        self._stop_blinking()
         if hasattr(self, 'validation_button'):
             self.validation_button.config(bg=COLORS['primary'], text="🔄 VALIDATING...")
             self.validation_button.config(state='disabled')
@@ -1359,38 +1903,36 @@ class SudokuGame:
         validation_errors = []
         conflict_cells = []
         
-        for i in range(9):
-            for j in range(9):
-                if preview_puzzle[i][j] != 0:
-                    num = preview_puzzle[i][j]
-                    
-                    for col in range(9):
-                        if col != j and preview_puzzle[i][col] == num:
-                            error_msg = f"Row {i+1}: Number {num} appears in columns {j+1} and {col+1}"
-                            if error_msg not in validation_errors:
-                                validation_errors.append(error_msg)
-                            conflict_cells.extend([(i, j), (i, col)])
-                    
-                    for row in range(9):
-                        if row != i and preview_puzzle[row][j] == num:
-                            error_msg = f"Column {j+1}: Number {num} appears in rows {i+1} and {row+1}"
-                            if error_msg not in validation_errors:
-                                validation_errors.append(error_msg)
-                            conflict_cells.extend([(i, j), (row, j)])
-                    
-                    start_row, start_col = 3 * (i // 3), 3 * (j // 3)
-                    for r in range(start_row, start_row + 3):
-                        for c in range(start_col, start_col + 3):
-                            if (r != i or c != j) and preview_puzzle[r][c] == num:
-                                box_num = (i // 3) * 3 + (j // 3) + 1
-                                error_msg = f"Box {box_num}: Number {num} appears at ({i+1},{j+1}) and ({r+1},{c+1})"
-                                if error_msg not in validation_errors:
-                                    validation_errors.append(error_msg)
-                                conflict_cells.extend([(i, j), (r, c)])
-        
-        conflict_cells = list(set(conflict_cells))
-        for i, j in conflict_cells:
-            preview_cells[i][j].config(bg=COLORS['error_light'], fg=COLORS['error'])
+        # Single pass: each digit is compared only with the earlier cells that
+        # hold the same digit in its row, column and box
+        row_seen = [[[] for _ in range(10)] for _ in range(9)]
+        col_seen = [[[] for _ in range(10)] for _ in range(9)]
+        box_seen = [[[] for _ in range(10)] for _ in range(9)]
+        
+        for idx in range(81):
+            i, j, box = ROW_OF[idx], COL_OF[idx], BOX_OF[idx]
+            num = preview_puzzle[i][j]
+            if num == 0:
+                continue
+            
+            for col in row_seen[i][num]:
+                validation_errors.append(f"Row {i+1}: Number {num} appears in columns {col+1} and {j+1}")
+                conflict_cells.extend([(i, col), (i, j)])
+            
+            for row in col_seen[j][num]:
+                validation_errors.append(f"Column {j+1}: Number {num} appears in rows {row+1} and {i+1}")
+                conflict_cells.extend([(row, j), (i, j)])
+            
+            for r, c in box_seen[box][num]:
+                validation_errors.append(f"Box {box+1}: Number {num} appears at ({r+1},{c+1}) and ({i+1},{j+1})")
+                conflict_cells.extend([(r, c), (i, j)])
+            
+            row_seen[i][num].append(j)
+            col_seen[j][num].append(i)
+            box_seen[box][num].append((i, j))
+        
+        for i, j in set(conflict_cells):
+            _set_color(preview_cells[i][j], COLORS['error_light'], COLORS['error'])
         
         results_frame = tk.Frame(validation_frame, bg=COLORS['white'])
         results_frame.pack(pady=20, fill="x")
@@ -1399,7 +1941,7 @@ class SudokuGame:
             tk.Label(
                 results_frame,
                 text="❌ VALIDATION FAILED",
-                font=('Segoe UI', 14, 'bold'),
+                font=self.fonts['bold_14'],
                 fg=COLORS['error'],
                 bg=COLORS['white']
             ).pack()
@@ -1407,7 +1949,7 @@ class SudokuGame:
             tk.Label(
                 results_frame,
                 text=f"Found {len(validation_errors)} rule violation(s):",
-                font=('Segoe UI', 12),
+                font=self.fonts['normal_12'],
                 fg=COLORS['error'],
                 bg=COLORS['white']
             ).pack(pady=5)
@@ -1419,7 +1961,7 @@ class SudokuGame:
                 tk.Label(
                     error_frame,
                     text=f"• {error}",
-                    font=('Segoe UI', 10),
+                    font=self.fonts['normal_10'],
                     fg=COLORS['error'],
                     bg=COLORS['error_light'],
                     anchor='w'
@@ -1429,7 +1971,7 @@ class SudokuGame:
                 tk.Label(
                     error_frame,
                     text=f"... and {len(validation_errors) - 5} more errors",
-                    font=('Segoe UI', 10, 'italic'),
+                    font=self.fonts['italic_10'],
                     fg=COLORS['error'],
                     bg=COLORS['error_light']
                 ).pack(pady=5)
@@ -1439,69 +1981,88 @@ class SudokuGame:
                 text="📝 Fix Errors in File",
                 command=preview_window.destroy,
                 bg_color=COLORS['error'],
-                font=('Segoe UI', 12, 'bold')
+                font=self.fonts['bold_12']
             ).pack(pady=10)
             
+            self._mark_preview_validated()
+            
         else:
-            test_board = copy.deepcopy(preview_puzzle)
-            is_solvable = SmartSudokuSolver.solve(test_board)
+            # One bounded search answers both "solvable?" and "unique?"; it
+            # runs off the Tk thread and the result is picked up by polling
+            future = self._exec.submit(SmartSudokuSolver.find_solutions, flatten_board(preview_puzzle), 2)
+            self.master.after(20, self._poll_preview_validation, future, preview_puzzle, results_frame, preview_window)
+
+    def _poll_preview_validation(self, future, preview_puzzle, results_frame, preview_window):
+        """Wait for the background solve without blocking the event loop"""
+        if not future.done():
+            self.master.after(20, self._poll_preview_validation, future, preview_puzzle, results_frame, preview_window)
+            return
+        if preview_window.winfo_exists():
+            self._finish_preview_validation(future.result(), preview_puzzle, results_frame, preview_window)
+
+    def _finish_preview_validation(self, solutions, preview_puzzle, results_frame, preview_window):
+        """Show the outcome of the background solve"""
+        if solutions:
+            solution_count = len(solutions)
+            solution = unflatten_board(solutions[0])
             
-            if is_solvable:
-                solution_count = SmartSudokuSolver.count_solutions(preview_puzzle, 2)
-                
-                tk.Label(
-                    results_frame,
-                    text="✅ VALIDATION PASSED",
-                    font=('Segoe UI', 14, 'bold'),
-                    fg=COLORS['success'],
-                    bg=COLORS['white']
-                ).pack()
-                
-                clue_count = sum(1 for i in range(9) for j in range(9) if preview_puzzle[i][j] != 0)
-                auto_difficulty = "expert" if clue_count < 25 else "hard" if clue_count < 30 else "medium" if clue_count < 35 else "easy"
-                
-                info_text = f"✓ No rule violations found\n✓ Puzzle is solvable\n"
-                info_text += f"📊 Clues: {clue_count}/81\n📈 Difficulty: {auto_difficulty.title()}\n"
-                info_text += f"🎯 Solutions: {solution_count} ({'Unique' if solution_count == 1 else 'Multiple'})"
-                
-                tk.Label(
-                    results_frame,
-                    text=info_text,
-                    font=('Segoe UI', 11),
-                    fg=COLORS['success'],
-                    bg=COLORS['white'],
-                    justify='center'
-                ).pack(pady=10)
-                
-                ModernButton(
-                    results_frame,
-                    text="🚀 LOAD PUZZLE",
-                    command=lambda: self.confirm_load_puzzle(preview_puzzle, test_board, preview_window),
-                    bg_color=COLORS['success'],
-                    font=('Segoe UI', 14, 'bold'),
-                    pady=12,
-                    padx=30
-                ).pack(pady=15)
-                
-            else:
-                tk.Label(
-                    results_frame,
-                    text="❌ PUZZLE UNSOLVABLE",
-                    font=('Segoe UI', 14, 'bold'),
-                    fg=COLORS['error'],
-                    bg=COLORS['white']
-                ).pack()
-                
-                tk.Label(
-                    results_frame,
-                    text="This puzzle has no valid solution.\nPlease check the input file.",
-                    font=('Segoe UI', 12),
-                    fg=COLORS['error'],
-                    bg=COLORS['white'],
-                    justify='center'
-                ).pack(pady=10)
+            tk.Label(
+                results_frame,
+                text="✅ VALIDATION PASSED",
+                font=self.fonts['bold_14'],
+                fg=COLORS['success'],
+                bg=COLORS['white']
+            ).pack()
+            
+            clue_count = sum(1 for i in range(9) for j in range(9) if preview_puzzle[i][j] != 0)
+            auto_difficulty = "expert" if clue_count < 25 else "hard" if clue_count < 30 else "medium" if clue_count < 35 else "easy"
+            
+            info_text = f"✓ No rule violations found\n✓ Puzzle is solvable\n"
+            info_text += f"📊 Clues: {clue_count}/81\n📈 Difficulty: {auto_difficulty.title()}\n"
+            info_text += f"🎯 Solutions: {solution_count} ({'Unique' if solution_count == 1 else 'Multiple'})"
+            
+            tk.Label(
+                results_frame,
+                text=info_text,
+                font=self.fonts['normal_11'],
+                fg=COLORS['success'],
+                bg=COLORS['white'],
+                justify='center'
+            ).pack(pady=10)
+            
+            ModernButton(
+                results_frame,
+                text="🚀 LOAD PUZZLE",
+                command=lambda: self.confirm_load_puzzle(preview_puzzle, solution, preview_window),
+                bg_color=COLORS['success'],
+                font=self.fonts['bold_14'],
+                pady=12,
+                padx=30
+            ).pack(pady=15)
+            
+        else:
+            tk.Label(
+                results_frame,
+                text="❌ PUZZLE UNSOLVABLE",
+                font=self.fonts['bold_14'],
+                fg=COLORS['error'],
+                bg=COLORS['white']
+            ).pack()
+            
+            tk.Label(
+                results_frame,
+                text="This puzzle has no valid solution.\nPlease check the input file.",
+                font=self.fonts['normal_12'],
+                fg=COLORS['error'],
+                bg=COLORS['white'],
+                justify='center'
+            ).pack(pady=10)
         
-        if hasattr(self, 'validation_button'):
+        self._mark_preview_validated()
+
+    def _mark_preview_validated(self):
+        """Grey out the validation button once a verdict is shown"""
+        if hasattr(self, 'validation_button') and self.validation_button.winfo_exists():
             self.validation_button.config(
                 bg=COLORS['gray_500'], 
                 text="✅ VALIDATED",
@@ -1511,8 +2072,9 @@ class SudokuGame:
     def confirm_load_puzzle(self, preview_puzzle, solution, preview_window):
         """Load the validated puzzle"""
         self.puzzle = preview_puzzle
-        self.original_puzzle = copy.deepcopy(preview_puzzle)
-        self.user_puzzle = copy.deepcopy(preview_puzzle)
+        self.original_puzzle = tuple(tuple(row) for row in preview_puzzle)
+        self.user_puzzle = [row[:] for row in preview_puzzle]
+        self._reset_masks()
         self.solution = solution
         
         self.update_board_display()
@@ -1544,26 +2106,16 @@ class SudokuGame:
             return
         
         try:
+            digits = [str(num) for row in self.user_puzzle for num in row]
+            lines = ["".join(digits), "\n\n# Formatted view:\n"]
+            for i in range(9):
+                row = digits[i * 9:i * 9 + 9]
+                lines.append(f"# {' '.join(row[0:3])} | {' '.join(row[3:6])} | {' '.join(row[6:9])}\n")
+                if i % 3 == 2 and i != 8:
+                    lines.append("# ------+-------+------\n")
+            
             with open(file_path, 'w') as file:
-                puzzle_string = ""
-                for i in range(9):
-                    for j in range(9):
-                        puzzle_string += str(self.user_puzzle[i][j])
-                
-                file.write(puzzle_string)
-                
-                file.write("\n\n# Formatted view:\n")
-                for i in range(9):
-                    row = ""
-                    for j in range(9):
-                        row += str(self.user_puzzle[i][j])
-                        if j % 3 == 2 and j != 8:
-                            row += " | "
-                        elif j != 8:
-                            row += " "
-                    file.write(f"# {row}\n")
-                    if i % 3 == 2 and i != 8:
-                        file.write("# ------+-------+------\n")
+                file.writelines(lines)
             
             messagebox.showinfo(
                 "💾 Save Successful", 
@@ -1576,29 +2128,25 @@ class SudokuGame:
 
     def update_board_display(self):
         """Update the visual display of the board"""
-        for i in range(9):
-            for j in range(9):
-                entry = self.cells[i][j]
-                entry.config(state="normal")
-                entry.delete(0, tk.END)
-                
-                if self.puzzle[i][j] != 0:
-                    entry.insert(0, str(self.puzzle[i][j]))
-                    entry.config(
-                        state="readonly",
-                        readonlybackground=COLORS['gray_200'],
-                        fg=COLORS['gray_900'],
-                        font=('Segoe UI', 24, 'bold')
-                    )
-                else:
-                    entry.config(
-                        bg=COLORS['white'], 
-                        fg=self.button_color,
-                        insertbackground=self.button_color
-                    )
-                    entry.bind('<KeyRelease>', lambda e, r=i, c=j: self.on_cell_change(r, c))
-                    entry.bind('<FocusIn>', lambda e, r=i, c=j: self.on_focus_in(r, c))
-                    entry.bind('<FocusOut>', lambda e, r=i, c=j: self.on_focus_out(r, c))
+        self._cancel_pending_validation()
+        # Cell bindings and fonts are permanent, so a new board only needs
+        # each cell's text, state and colors reset
+        clue_fg = COLORS['gray_900']
+        white = COLORS['white']
+        for idx in range(81):
+            entry = self.cell_flat[idx]
+            value = self.puzzle[ROW_OF[idx]][COL_OF[idx]]
+            entry.config(state="normal")
+            entry.delete(0, tk.END)
+            
+            self.is_readonly[idx] = value != 0
+            if value != 0:
+                entry.insert(0, str(value))
+                entry.tk.call(entry._w, 'configure', '-state', 'readonly', '-bg', white, '-fg', clue_fg)
+            else:
+                entry.tk.call(entry._w, 'configure', '-bg', white, '-fg', self.button_color,
+                              '-insertbackground', self.button_color)
+        self._highlighted.clear()
 
     def new_game(self):
         """Start a new game"""
@@ -1606,9 +2154,10 @@ class SudokuGame:
             "🆕 New Game", 
             "Start a new game? Your current progress will be lost."
         ):
-            self.puzzle, self.solution = generate_puzzle(self.difficulty)
-            self.original_puzzle = copy.deepcopy(self.puzzle)
-            self.user_puzzle = copy.deepcopy(self.puzzle)
+            self.puzzle, self.solution = generate_puzzle_cached(self.difficulty)
+            self.original_puzzle = tuple(tuple(row) for row in self.puzzle)
+            self.user_puzzle = [row[:] for row in self.puzzle]
+            self._reset_masks()
             
             self.game_completed = False
             self.hints_used = 0
@@ -1626,101 +2175,159 @@ class SudokuGame:
     def change_difficulty(self, difficulty):
         """Change difficulty level"""
         self.difficulty = difficulty
-        self.difficulty_label.config(text=f"📊 Level: {difficulty.title()}")
+        self.difficulty_var.set(difficulty)
+        self.difficulty_label.config(text=DIFFICULTY_LABELS[difficulty])
         
         # Update difficulty button colors
-        difficulty_info = {
-            "easy": COLORS['success'],
-            "medium": COLORS['warning'],
-            "hard": COLORS['error'],
-            "expert": COLORS['gray_800']
-        }
-        
-        for diff, (btn, orig_color) in self.diff_buttons_refs.items():
-            if diff == difficulty:
-                btn.config(bg=orig_color)
-                btn.bg_color = orig_color
-            else:
-                btn.config(bg=COLORS['gray_400'])
-                btn.bg_color = COLORS['gray_400']
+        self._recolor_difficulty_buttons()
         
         self.new_game()
 
+    def _stop_timer(self):
+        """Stop the timer and cancel its pending tick"""
+        self.timer_running = False
+        if self._timer_after_id is not None:
+            self.master.after_cancel(self._timer_after_id)
+            self._timer_after_id = None
+
     def reset_timer(self):
         """Reset timer based on mode"""
-        if self.timer_mode.get() == "count_up":
+        self._stop_timer()
+        
+        # Every mode change goes through here, so the tick handler is picked
+        # once instead of re-reading the mode on every tick
+        mode = self.timer_mode.get()
+        self._timer_tick = self._timer_handlers.get(mode, self._tick_free)
+        if mode == "count_up":
             self.timer_seconds = 0
             self.timer_running = True
-        elif self.timer_mode.get() == "count_down":
+        elif mode == "count_down":
             self.timer_seconds = self.countdown_minutes.get() * 60
             self.timer_running = True
         else:
-            self.timer_running = False
-            self.timer_label.config(text="⏱ Free Play ∞")
+            # Free play shows a fixed label and needs no ticks at all
+            self._tick_free(0)
+            return
+        
+        # Elapsed time is measured against the monotonic clock, so late
+        # ticks never make the displayed time drift
+        self._timer_start = time.monotonic()
+        self._timer_base = self.timer_seconds
+        self.update_timer()
 
     def start_timer(self):
         """Start the timer"""
         self.reset_timer()
-        self.update_timer()
+
+    def _timer_text(self, total_seconds):
+        """Timer label text for a number of seconds"""
+        if total_seconds < len(_TIMER_TEXTS):
+            return _TIMER_TEXTS[total_seconds]
+        minutes, seconds = divmod(total_seconds, 60)
+        return f"⏱ {minutes:02d}:{seconds:02d}"
+
+    def _set_timer_text(self, text, fg=None):
+        """Update the timer label, skipping options that are unchanged"""
+        # fg=None means plain clock text in the current button color, which
+        # apply_button_theme repaints; any other fg is a status or threshold
+        # color that a theme change leaves alone
+        self._timer_display = (text, fg)
+        # Nobody sees the label while the window is minimized; _on_map
+        # catches it up when the window comes back
+        if not self._timer_visible:
+            return
+        # Applied directly rather than through _queue_config: one label
+        # changing once a second has nothing to coalesce with, and waiting
+        # for idle would only make the clock lag
+        if text != self._last_timer_text:
+            self.timer_label.config(text=text)
+            self._last_timer_text = text
+        # The color only changes at the countdown thresholds
+        color = self.button_color if fg is None else fg
+        if color != self._timer_fg:
+            self.timer_label.config(fg=color)
+            self._timer_fg = color
+
+    def _on_map(self, event):
+        """Redraw the timer label once the main window is shown again"""
+        if event.widget is self.master:
+            self._timer_visible = True
+            self._last_timer_text = None
+            self._timer_fg = None
+            self._set_timer_text(*self._timer_display)
+
+    def _on_unmap(self, event):
+        """Stop drawing the timer label while the main window is minimized"""
+        if event.widget is self.master:
+            self._timer_visible = False
 
     def update_timer(self):
         """Update timer display"""
-        if not self.game_completed:
-            if self.timer_mode.get() == "count_up" and self.timer_running:
-                minutes = self.timer_seconds // 60
-                seconds = self.timer_seconds % 60
-                self.timer_label.config(
-                    text=f"⏱ {minutes:02d}:{seconds:02d}",
-                    fg=self.button_color
-                )
-                self.timer_seconds += 1
-                
-            elif self.timer_mode.get() == "count_down" and self.timer_running:
-                if self.timer_seconds > 0:
-                    minutes = self.timer_seconds // 60
-                    seconds = self.timer_seconds % 60
-                    
-                    if self.timer_seconds <= 60:
-                        color = COLORS['error']
-                    elif self.timer_seconds <= 300:
-                        color = COLORS['warning']
-                    else:
-                        color = self.button_color
-                    
-                    self.timer_label.config(
-                        text=f"⏱ {minutes:02d}:{seconds:02d}",
-                        fg=color
-                    )
-                    self.timer_seconds -= 1
-                else:
-                    self.timer_running = False
-                    self.timer_label.config(
-                        text="⏱ Time's Up! ⏰",
-                        fg=COLORS['error']
-                    )
-                    messagebox.showwarning(
-                        "⏰ Time's Up!", 
-                        "Your time has expired!\n\n"
-                        "You can continue playing without time pressure,\n"
-                        "or start a new game."
-                    )
-            elif self.timer_mode.get() == "free":
-                self.timer_label.config(
-                    text="⏱ Free Play ∞",
-                    fg=COLORS['gray_600']
-                )
+        self._timer_after_id = None
+        if self.game_completed or not self.timer_running:
+            return
+        
+        self._timer_tick(int(time.monotonic() - self._timer_start))
+        
+        if self.timer_running:
+            # Wake just after the next whole second since the reset rather
+            # than a flat 1000 ms later, so ticks stay on a 1 Hz grid and
+            # ticks missed behind a modal dialog are skipped, not replayed
+            since_start = time.monotonic() - self._timer_start
+            delay = int((int(since_start) + 1 - since_start) * 1000) + 1
+            self._timer_after_id = self.master.after(delay, self.update_timer)
+
+    def _tick_up(self, elapsed):
+        """Count-up tick"""
+        self.timer_seconds = self._timer_base + elapsed
+        self._set_timer_text(self._timer_text(self.timer_seconds))
+
+    def _tick_down(self, elapsed):
+        """Countdown tick; stops the timer when time runs out"""
+        self.timer_seconds = max(0, self._timer_base - elapsed)
+        if self.timer_seconds == 0:
+            self.timer_running = False
+            self._set_timer_text("⏱ Time's Up! ⏰", COLORS['error'])
+            messagebox.showwarning(
+                "⏰ Time's Up!", 
+                "Your time has expired!\n\n"
+                "You can continue playing without time pressure,\n"
+                "or start a new game."
+            )
+            return
         
-        self.master.after(1000, self.update_timer)
+        if self.timer_seconds <= 60:
+            color = COLORS['error']
+        elif self.timer_seconds <= 300:
+            color = COLORS['warning']
+        else:
+            color = None
+        
+        self._set_timer_text(self._timer_text(self.timer_seconds), color)
+
+    def _tick_free(self, elapsed):
+        """Free play has no clock; show its label and stop ticking"""
+        self.timer_running = False
+        self._set_timer_text("⏱ Free Play ∞", COLORS['gray_600'])
 
     def show_help(self):
         """Display help dialog"""
+        # The window is built once and only hidden when closed
+        if self._help_window is not None and self._help_window.winfo_exists():
+            self._help_window.deiconify()
+            self._help_window.lift()
+            self._help_window.grab_set()
+            return
+        
         help_window = tk.Toplevel(self.master)
+        self._help_window = help_window
         help_window.title("❓ Sudoku Master - Help")
         help_window.geometry("600x700")
         help_window.configure(bg=COLORS['white'])
         help_window.resizable(False, False)
         help_window.transient(self.master)
         help_window.grab_set()
+        help_window.protocol("WM_DELETE_WINDOW", self._hide_help)
         
         header_frame = tk.Frame(help_window, bg=COLORS['primary'])
         header_frame.pack(fill="x")
@@ -1728,7 +2335,7 @@ class SudokuGame:
         tk.Label(
             header_frame,
             text="🎯 SUDOKU MASTER - HELP",
-            font=('Segoe UI', 20, 'bold'),
+            font=self.fonts['bold_20'],
             fg=COLORS['white'],
             bg=COLORS['primary'],
             pady=15
@@ -1740,7 +2347,7 @@ class SudokuGame:
         text_area = tk.Text(
             content_frame,
             wrap="word",
-            font=('Segoe UI', 11),
+            font=self.fonts['normal_11'],
             bg=COLORS['gray_50'],
             fg=COLORS['gray_800'],
             padx=15,
@@ -1750,150 +2357,189 @@ class SudokuGame:
         )
         text_area.pack(fill="both", expand=True)
         
-        help_content = """🎯 HOW TO PLAY SUDOKU
-
-📋 BASIC RULES:
-• Fill each row with numbers 1-9 (no duplicates)
-• Fill each column with numbers 1-9 (no duplicates)
-• Fill each 3×3 box with numbers 1-9 (no duplicates)
-
-🎮 NEW FEATURES:
-
-🎨 THEME CUSTOMIZATION:
-• Change background color independently
-• Change button colors separately
-• Personalize your gaming experience
-
-📥 DOWNLOAD SOLUTION:
-• Save completed puzzles as .txt files
-• Download full solution even if not complete
-• Includes formatted view and statistics
-
-🔍 AUTO-CHECK TOGGLE:
-• Turn ON: See colors (green=correct, yellow=valid, red=wrong)
-• Turn OFF: Play without hints, check at the end
-• Toggle anytime during gameplay
-
-⏰ CUSTOM COUNTDOWN:
-• Set your own countdown timer (1-60 minutes)
-• Choose Count Up, Count Down, or Free Play mode
-• Timer changes color as time runs out
-
-💡 SMART HINTS:
-• Hints target cells with fewest possibilities
-• Track hints used for scoring
-• Yellow highlight for hint cells
-
-🏆 DIFFICULTY LEVELS:
-• Easy: 40+ clues
-• Medium: 32+ clues
-• Hard: 26+ clues
-• Expert: 22+ clues
-
-📁 FILE FORMAT (.txt):
-• Exactly 81 digits in sequence
-• 0 = empty, 1-9 = filled
-• Example: 530070000600195000...
-
-⌨️ CONTROLS:
-• 1-9: Enter numbers
-• Backspace/Delete: Clear cell
-• Tab: Next cell
-
-🎓 CREATED BY:
-Mutaib • Andrie • Fawad
-Universitas Syiah Kuala © 2025"""
-
-        text_area.insert("1.0", help_content)
+        text_area.insert("1.0", HELP_CONTENT)
         text_area.config(state="disabled")
         
         ModernButton(
             help_window,
             text="✅ Got It!",
-            command=help_window.destroy,
+            command=self._hide_help,
             bg_color=COLORS['primary'],
-            font=('Segoe UI', 12, 'bold')
+            font=self.fonts['bold_12']
         ).pack(pady=15)
 
+    def _hide_help(self):
+        """Hide the help dialog so the next show_help can reuse it"""
+        self._help_window.grab_release()
+        self._help_window.withdraw()
+
 # ------------------- Main Application -------------------
 
+def _build_menu(menu, items):
+    """Fill a menu from a table of (label, command) items"""
+    # None adds a separator; a tuple of items in place of the command
+    # becomes a cascade, whose entries are only added once it is opened;
+    # (label, command, variable, value) adds a radio entry
+    for item in items:
+        if item is None:
+            menu.add_separator()
+            continue
+        if len(item) == 4:
+            label, action, variable, value = item
+            menu.add_radiobutton(label=label, command=action, variable=variable, value=value)
+            continue
+        label, action = item
+        if isinstance(action, tuple):
+            submenu = tk.Menu(menu, tearoff=0)
+            submenu.configure(postcommand=functools.partial(_populate_once, submenu, action))
+            menu.add_cascade(label=label, menu=submenu)
+        else:
+            menu.add_command(label=label, command=action)
+
+def _populate_once(menu, items):
+    """postcommand of a lazily built menu: add its entries on first open"""
+    if getattr(menu, '_populated', False):
+        return
+    menu._populated = True
+    _build_menu(menu, items)
+
 def main():
     """Main application entry point"""
+    start_puzzle_pool()
     root = tk.Tk()
     
-    try:
-        pass
-    except:
-        pass
-    
-    menubar = tk.Menu(root)
-    root.config(menu=menubar)
-    
-    file_menu = tk.Menu(menubar, tearoff=0)
-    menubar.add_cascade(label="📁 File", menu=file_menu)
-    
-    game_menu = tk.Menu(menubar, tearoff=0)
-    menubar.add_cascade(label="🎮 Game", menu=game_menu)
+    game = SudokuGame(root)
     
-    settings_menu = tk.Menu(menubar, tearoff=0)
-    menubar.add_cascade(label="⚙️ Settings", menu=settings_menu)
+    def show_about():
+        messagebox.showinfo(
+            "About Sudoku Master",
+            "🎯 Sudoku Master - Enhanced Edition\n\n"
+            "Features:\n"
+            "• Theme customization\n"
+            "• Download solutions\n"
+            "• Custom countdown timer\n"
+            "• Auto-check toggle\n"
+            "• Smart hints\n\n"
+            "👨‍💻 Created by:\n"
+            "MUTAIB • ANDRIE • FAWAD\n\n"
+            "🏛 Universitas Syiah Kuala\n"
+            "© 2025"
+        )
     
-    help_menu = tk.Menu(menubar, tearoff=0)
-    menubar.add_cascade(label="❓ Help", menu=help_menu)
+    menus = (
+        ("📁 File", (
+            ("🆕 New Game", game.new_game),
+            None,
+            ("📁 Upload Puzzle", game.load_from_file),
+            ("💾 Save Puzzle", game.save_to_file),
+            ("📥 Download Solution", game.download_solution),
+            None,
+            ("❌ Exit", root.quit),
+        )),
+        ("🎮 Game", (
+            ("✅ Check Solution", game.check_solution),
+            ("🔍 Show Solution", game.show_solution),
+            ("💡 Get Hint", game.give_hint),
+            None,
+            ("🗑 Clear Board", game.clear_board),
+        )),
+        ("⚙️ Settings", (
+            ("📊 Difficulty", (
+                ("😊 Easy", functools.partial(game.change_difficulty, "easy"), game.difficulty_var, "easy"),
+                ("🙂 Medium", functools.partial(game.change_difficulty, "medium"), game.difficulty_var, "medium"),
+                ("😤 Hard", functools.partial(game.change_difficulty, "hard"), game.difficulty_var, "hard"),
+                ("🤯 Expert", functools.partial(game.change_difficulty, "expert"), game.difficulty_var, "expert"),
+            )),
+            None,
+            ("🎨 Change Background", game.change_bg_color),
+            ("🖌 Change Buttons", game.change_button_color),
+        )),
+        ("❓ Help", (
+            ("📖 How to Play", game.show_help),
+            None,
+            ("ℹ️ About", show_about),
+        )),
+    )
     
-    game = SudokuGame(root)
+    menubar = tk.Menu(root)
+    _build_menu(menubar, menus)
+    root.config(menu=menubar)
     
-    file_menu.add_command(label="🆕 New Game", command=lambda: game.new_game())
-    file_menu.add_separator()
-    file_menu.add_command(label="📁 Upload Puzzle", command=lambda: game.load_from_file())
-    file_menu.add_command(label="💾 Save Puzzle", command=lambda: game.save_to_file())
-    file_menu.add_command(label="📥 Download Solution", command=lambda: game.download_solution())
-    file_menu.add_separator()
-    file_menu.add_command(label="❌ Exit", command=root.quit)
+    # The quit confirmation is built once, hidden, and only shown on close
+    quit_dialog = tk.Toplevel(root)
+    quit_dialog.withdraw()
+    quit_dialog.transient(root)
+    quit_dialog.title("Quit")
+    quit_dialog.configure(bg=COLORS['white'])
+    quit_dialog.resizable(False, False)
     
-    game_menu.add_command(label="✅ Check Solution", command=lambda: game.check_solution())
-    game_menu.add_command(label="🔍 Show Solution", command=lambda: game.show_solution())
-    game_menu.add_command(label="💡 Get Hint", command=lambda: game.give_hint())
-    game_menu.add_separator()
-    game_menu.add_command(label="🗑 Clear Board", command=lambda: game.clear_board())
+    # Modal window that held the grab before the quit dialog took it
+    previous_grab = None
     
-    difficulty_menu = tk.Menu(settings_menu, tearoff=0)
-    settings_menu.add_cascade(label="📊 Difficulty", menu=difficulty_menu)
-    difficulty_menu.add_command(label="😊 Easy", command=lambda: game.change_difficulty("easy"))
-    difficulty_menu.add_command(label="🙂 Medium", command=lambda: game.change_difficulty("medium"))
-    difficulty_menu.add_command(label="😤 Hard", command=lambda: game.change_difficulty("hard"))
-    difficulty_menu.add_command(label="🤯 Expert", command=lambda: game.change_difficulty("expert"))
+    def cancel_quit(event=None):
+        quit_dialog.grab_release()
+        quit_dialog.withdraw()
+        # Hand the grab back so a preview, help or celebration window that
+        # was open stays modal
+        if previous_grab is not None and previous_grab.winfo_exists():
+            previous_grab.grab_set()
     
-    settings_menu.add_separator()
-    settings_menu.add_command(label="🎨 Change Background", command=lambda: game.change_bg_color())
-    settings_menu.add_command(label="🖌 Change Buttons", command=lambda: game.change_button_color())
+    tk.Label(
+        quit_dialog,
+        text="Do you want to quit Sudoku Master?",
+        font=game.fonts['normal_12'],
+        fg=COLORS['gray_800'],
+        bg=COLORS['white'],
+        padx=25,
+        pady=15
+    ).pack()
     
-    help_menu.add_command(label="📖 How to Play", command=lambda: game.show_help())
-    help_menu.add_separator()
-    help_menu.add_command(label="ℹ️ About", command=lambda: messagebox.showinfo(
-        "About Sudoku Master",
-        "🎯 Sudoku Master - Enhanced Edition\n\n"
-        "Features:\n"
-        "• Theme customization\n"
-        "• Download solutions\n"
-        "• Custom countdown timer\n"
-        "• Auto-check toggle\n"
-        "• Smart hints\n\n"
-        "👨‍💻 Created by:\n"
-        "MUTAIB • ANDRIE • FAWAD\n\n"
-        "🏛 Universitas Syiah Kuala\n"
-        "© 2025"
-    ))
+    quit_buttons = tk.Frame(quit_dialog, bg=COLORS['white'])
+    quit_buttons.pack(pady=(0, 15))
+    ModernButton(
+        quit_buttons,
+        text="OK",
+        command=root.destroy,
+        bg_color=COLORS['primary'],
+        font=game.fonts['bold_11'],
+        padx=20
+    ).pack(side="left", padx=8)
+    ModernButton(
+        quit_buttons,
+        text="Cancel",
+        command=cancel_quit,
+        bg_color=COLORS['gray_600'],
+        font=game.fonts['bold_11'],
+        padx=20
+    ).pack(side="left", padx=8)
     
-    root.update_idletasks()
+    quit_dialog.protocol("WM_DELETE_WINDOW", cancel_quit)
+    quit_dialog.bind("<Return>", lambda e: root.destroy())
+    quit_dialog.bind("<Escape>", cancel_quit)
     
     def on_closing():
-        if messagebox.askokcancel("Quit", "Do you want to quit Sudoku Master?"):
-            root.destroy()
+        nonlocal previous_grab
+        try:
+            grab = root.grab_current()
+        except KeyError:
+            # Held by a Tk-internal dialog with no tkinter widget
+            grab = None
+        if grab is not quit_dialog:
+            previous_grab = grab
+        quit_dialog.update_idletasks()
+        x = root.winfo_rootx() + (root.winfo_width() - quit_dialog.winfo_reqwidth()) // 2
+        y = root.winfo_rooty() + (root.winfo_height() - quit_dialog.winfo_reqheight()) // 2
+        quit_dialog.geometry(f"+{x}+{y}")
+        quit_dialog.deiconify()
+        quit_dialog.lift()
+        quit_dialog.focus_set()
+        quit_dialog.grab_set()
     
     root.protocol("WM_DELETE_WINDOW", on_closing)
     
     root.mainloop()
+    stop_puzzle_pool()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    multiprocessing.freeze_support()
+    main()